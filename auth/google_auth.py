@@ -5,6 +5,8 @@ import json
 import jwt
 import logging
 import os
+import threading
+import weakref
 
 from typing import List, Optional, Tuple, Dict, Any
 from urllib.parse import parse_qs, urlparse
@@ -13,7 +15,9 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 from auth.scopes import SCOPES, get_current_scopes  # noqa
 from auth.oauth21_session_store import get_oauth21_session_store
@@ -24,6 +28,7 @@ from core.config import (
     get_oauth_redirect_uri,
 )
 from core.context import get_fastmcp_session_id
+from core.http_client import get_google_http
 
 # Try to import FastMCP dependencies (may not be available in all environments)
 try:
@@ -750,6 +755,111 @@ def get_credentials(
         return None
 
 
+# Parsed discovery documents keyed by (service name, version). Each call still
+# builds its own service object around its own credentials; only the parsed
+# document is shared.
+_discovery_documents: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+_discovery_documents_lock = threading.Lock()
+
+# Credentials behind each service from build_google_service(), for tools
+# that call REST endpoints directly instead of through the service
+_service_credentials: "weakref.WeakKeyDictionary[Any, Credentials]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Credential loads in flight, so concurrent tool calls for the same user and
+# scopes share one load (and one token refresh). Entries are removed as soon
+# as the load finishes.
+_pending_credential_loads: Dict[Tuple[str, Tuple[str, ...], Optional[str]], Any] = {}
+
+
+def _get_discovery_document(
+    service_name: str, version: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the parsed discovery document bundled with googleapiclient, or None if
+    the API has no bundled document.
+
+    googleapiclient fills in extra method parameters on the document the first
+    time each resource is built, so every resource is built once before the
+    document is shared. Later builds then find those parameters already there.
+    """
+    cache_key = (service_name, version)
+    with _discovery_documents_lock:
+        if cache_key in _discovery_documents:
+            return _discovery_documents[cache_key]
+
+        content = discovery_cache.get_static_doc(service_name, version)
+        document = json.loads(content) if content else None
+        if document is not None:
+
+            def _build_resources(resource, resource_desc):
+                for name, nested_desc in resource_desc.get("resources", {}).items():
+                    _build_resources(getattr(resource, name)(), nested_desc)
+
+            _build_resources(
+                build_from_document(document, http=get_google_http()), document
+            )
+        _discovery_documents[cache_key] = document
+        return document
+
+
+def build_google_service(service_name: str, version: str, credentials: Credentials):
+    """
+    Build a Google API client service on the shared HTTP transport.
+
+    Services reuse per-thread keep-alive connections instead of opening new
+    TLS connections for every tool call, and are built from a cached discovery
+    document instead of re-reading and parsing it.
+    """
+    http = AuthorizedHttp(credentials, http=get_google_http())
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        service = build(service_name, version, http=http)
+    else:
+        service = build_from_document(document, http=http)
+    _service_credentials[service] = credentials
+    return service
+
+
+def get_service_credentials(service) -> Credentials:
+    """Get the credentials a service from build_google_service() authorizes with."""
+    return _service_credentials[service]
+
+
+async def _load_credentials_shared(
+    user_google_email: str,
+    required_scopes: List[str],
+    session_id: Optional[str],
+) -> Optional[Credentials]:
+    """
+    Load credentials in a worker thread, joining a load already in flight for
+    the same user, scopes and session instead of starting another.
+    """
+    load_key = (user_google_email, tuple(sorted(required_scopes)), session_id)
+    loop = asyncio.get_running_loop()
+    pending = _pending_credential_loads.get(load_key)
+    if pending is None or pending.get_loop() is not loop:
+        pending = loop.create_task(
+            asyncio.to_thread(
+                get_credentials,
+                user_google_email=user_google_email,
+                required_scopes=required_scopes,
+                client_secrets_path=CONFIG_CLIENT_SECRETS_PATH,
+                session_id=session_id,  # Pass through session context
+            )
+        )
+        _pending_credential_loads[load_key] = pending
+
+        def _forget(task, load_key=load_key):
+            if _pending_credential_loads.get(load_key) is task:
+                del _pending_credential_loads[load_key]
+
+        pending.add_done_callback(_forget)
+    # Shielded so one caller being cancelled doesn't cancel the shared load
+    return await asyncio.shield(pending)
+
+
 def get_user_info(credentials: Credentials) -> Optional[Dict[str, Any]]:
     """Fetches basic user profile information (requires userinfo.email scope)."""
     if not credentials or not credentials.valid:
@@ -758,7 +868,7 @@ def get_user_info(credentials: Credentials) -> Optional[Dict[str, Any]]:
     try:
         # Using googleapiclient discovery to get user info
         # Requires 'google-api-python-client' library
-        service = build("oauth2", "v2", credentials=credentials)
+        service = build_google_service("oauth2", "v2", credentials)
         user_info = service.userinfo().get().execute()
         logger.info(f"Successfully fetched user info: {user_info.get('email')}")
         return user_info
@@ -860,12 +970,8 @@ async def get_authenticated_google_service(
         logger.info(f"[{tool_name}] {error_msg}")
         raise GoogleAuthenticationError(error_msg)
 
-    credentials = await asyncio.to_thread(
-        get_credentials,
-        user_google_email=user_google_email,
-        required_scopes=required_scopes,
-        client_secrets_path=CONFIG_CLIENT_SECRETS_PATH,
-        session_id=session_id,  # Pass through session context
+    credentials = await _load_credentials_shared(
+        user_google_email, required_scopes, session_id
     )
 
     if not credentials or not credentials.valid:
@@ -901,7 +1007,7 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, credentials=credentials)
+        service = build_google_service(service_name, version, credentials)
         log_user_email = user_google_email
 
         # Try to get email from credentials if needed for validation
@@ -7,6 +7,7 @@ Files are automatically cleaned up after expiration (default 1 hour).
 
 import base64
 import logging
+import shutil
 import uuid
 from pathlib import Path
 from typing import Optional, Dict
@@ -57,21 +58,7 @@ class AttachmentStorage:
             raise ValueError(f"Invalid base64 data: {e}")
 
         # Determine file extension from filename or mime type
-        extension = ""
-        if filename:
-            extension = Path(filename).suffix
-        elif mime_type:
-            # Basic mime type to extension mapping
-            mime_to_ext = {
-                "image/jpeg": ".jpg",
-                "image/png": ".png",
-                "image/gif": ".gif",
-                "application/pdf": ".pdf",
-                "application/zip": ".zip",
-                "text/plain": ".txt",
-                "text/html": ".html",
-            }
-            extension = mime_to_ext.get(mime_type, "")
+        extension = self._get_extension(filename, mime_type)
 
         # Save file
         file_path = STORAGE_DIR / f"{file_id}{extension}"
@@ -84,19 +71,85 @@ class AttachmentStorage:
             logger.error(f"Failed to save attachment to {file_path}: {e}")
             raise
 
-        # Store metadata
+        self._store_metadata(
+            file_id, file_path, filename, extension, mime_type, len(file_bytes)
+        )
+        return file_id
+
+    def save_attachment_from_path(
+        self,
+        source_path: str,
+        filename: Optional[str] = None,
+        mime_type: Optional[str] = None,
+    ) -> str:
+        """
+        Move an already-downloaded file into storage and return a unique file ID.
+
+        The source file is moved rather than copied, so callers that stream
+        downloads to a temporary file never need to hold the content in memory.
+
+        Args:
+            source_path: Path to the file to take ownership of
+            filename: Original filename (optional)
+            mime_type: MIME type (optional)
+
+        Returns:
+            Unique file ID (UUID string)
+        """
+        file_id = str(uuid.uuid4())
+        extension = self._get_extension(filename, mime_type)
+
+        file_path = STORAGE_DIR / f"{file_id}{extension}"
+        try:
+            shutil.move(source_path, file_path)
+            size = file_path.stat().st_size
+            logger.info(f"Saved attachment {file_id} ({size} bytes) to {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to save attachment to {file_path}: {e}")
+            raise
+
+        self._store_metadata(file_id, file_path, filename, extension, mime_type, size)
+        return file_id
+
+    @staticmethod
+    def _get_extension(filename: Optional[str], mime_type: Optional[str]) -> str:
+        """Determine file extension from filename or mime type."""
+        if filename:
+            return Path(filename).suffix
+        if mime_type:
+            # Basic mime type to extension mapping
+            mime_to_ext = {
+                "image/jpeg": ".jpg",
+                "image/png": ".png",
+                "image/gif": ".gif",
+                "application/pdf": ".pdf",
+                "application/zip": ".zip",
+                "text/plain": ".txt",
+                "text/html": ".html",
+            }
+            return mime_to_ext.get(mime_type, "")
+        return ""
+
+    def _store_metadata(
+        self,
+        file_id: str,
+        file_path: Path,
+        filename: Optional[str],
+        extension: str,
+        mime_type: Optional[str],
+        size: int,
+    ) -> None:
+        """Record metadata for a saved attachment."""
         expires_at = datetime.now() + timedelta(seconds=self.expiration_seconds)
         self._metadata[file_id] = {
             "file_path": str(file_path),
             "filename": filename or f"attachment{extension}",
             "mime_type": mime_type or "application/octet-stream",
-            "size": len(file_bytes),
+            "size": size,
             "created_at": datetime.now(),
             "expires_at": expires_at,
         }
 
-        return file_id
-
     def get_attachment_path(self, file_id: str) -> Optional[Path]:
         """
         Get the file path for an attachment ID.
@@ -20,6 +20,18 @@ from auth.oauth_config import (
 WORKSPACE_MCP_PORT = int(os.getenv("PORT", os.getenv("WORKSPACE_MCP_PORT", 8000)))
 WORKSPACE_MCP_BASE_URI = os.getenv("WORKSPACE_MCP_BASE_URI", "http://localhost")
 
+# Chunk size for streamed file downloads (1 MB); lower it on memory-constrained deployments
+DOWNLOAD_CHUNK_SIZE_BYTES = int(
+    os.getenv("WORKSPACE_MCP_DOWNLOAD_CHUNK_SIZE", 1024 * 1024)
+)
+
+# Parallel permission creates when a batch share falls back to single requests;
+# Drive allows roughly 10 writes per second per user
+DRIVE_SHARE_CONCURRENCY = int(os.getenv("WORKSPACE_MCP_DRIVE_SHARE_CONCURRENCY", 10))
+
+# Worker threads for blocking Google API calls made through asyncio.to_thread
+THREAD_POOL_SIZE = int(os.getenv("WORKSPACE_MCP_THREAD_POOL_SIZE", 32))
+
 # Disable USER_GOOGLE_EMAIL in OAuth 2.1 multi-user mode
 USER_GOOGLE_EMAIL = (
     None if is_oauth21_enabled() else os.getenv("USER_GOOGLE_EMAIL", None)
@@ -29,6 +41,9 @@ USER_GOOGLE_EMAIL = (
 __all__ = [
     "WORKSPACE_MCP_PORT",
     "WORKSPACE_MCP_BASE_URI",
+    "DOWNLOAD_CHUNK_SIZE_BYTES",
+    "DRIVE_SHARE_CONCURRENCY",
+    "THREAD_POOL_SIZE",
     "USER_GOOGLE_EMAIL",
     "get_oauth_base_url",
     "get_oauth_redirect_uri",
@@ -0,0 +1,114 @@
+"""
+Shared HTTP clients for Google API calls, direct REST calls and URL fetches.
+
+Tools reuse one pooled httpx.AsyncClient instead of opening a new client (and
+new TLS connections) per invocation. The client is closed when the server
+shuts down.
+
+Google API client services share per-thread httplib2 connections, so calls
+made from the same worker thread keep their connections alive across tools.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+import httplib2
+import httpx
+from googleapiclient.http import build_http
+
+logger = logging.getLogger(__name__)
+
+# Large downloads may stall between chunks, so reads get a longer allowance
+HTTP_TIMEOUT = httpx.Timeout(30.0, read=600.0)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Connections are bound to the event loop that opened them, so a new client
+    is created if the running loop has changed.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        if _http_client is not None and not _http_client.is_closed:
+            _close_client_on_loop(_http_client, _http_client_loop)
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def _close_client_on_loop(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    Close a client left behind by another event loop.
+
+    Its connections belong to that loop, so the close is scheduled there while
+    it is still running. Otherwise the loop can no longer run it and the
+    client's sockets are released when it is garbage collected.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        logger.debug("Scheduled close of HTTP client from a previous event loop")
+    else:
+        logger.debug(
+            "Dropping HTTP client from a previous event loop that is no longer running"
+        )
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.debug("Closed shared HTTP client")
+    _http_client = None
+    _http_client_loop = None
+
+
+class ThreadLocalHttp:
+    """
+    httplib2.Http stand-in that keeps one connection pool per thread.
+
+    httplib2.Http is not thread-safe, while API calls run on whichever worker
+    thread asyncio.to_thread picks. Each thread gets its own Http, which is
+    then reused by every service that calls from that thread.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def http(self) -> httplib2.Http:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            # build_http keeps 308 out of the redirect codes for resumable uploads
+            http = build_http()
+            self._local.http = http
+        return http
+
+    def request(self, *args, **kwargs):
+        return self.http.request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+
+_google_http = ThreadLocalHttp()
+
+
+def get_google_http() -> ThreadLocalHttp:
+    """Get the shared transport for Google API client services."""
+    return _google_http
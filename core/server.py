@@ -1,5 +1,8 @@
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import List, Optional
 from importlib import metadata
 
@@ -22,11 +25,14 @@ from auth.oauth_responses import (
 from auth.auth_info_middleware import AuthInfoMiddleware
 from auth.scopes import SCOPES, get_current_scopes  # noqa
 from core.config import (
+    THREAD_POOL_SIZE,
     USER_GOOGLE_EMAIL,
     get_transport_mode,
     set_transport_mode as _set_transport_mode,
     get_oauth_redirect_uri as get_oauth_redirect_uri_for_current_mode,
 )
+from core.http_client import close_http_client
+from core.utils import shutdown_office_extraction_pool, warm_office_extraction_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,9 +59,30 @@ class SecureFastMCP(FastMCP):
         return app
 
 
+@asynccontextmanager
+async def server_lifespan(app: FastMCP):
+    """Set up shared resources on startup and release them on shutdown."""
+    # Size the pool behind asyncio.to_thread explicitly instead of relying on
+    # the cpu-based default, since most of its work is waiting on the network
+    executor = ThreadPoolExecutor(
+        max_workers=THREAD_POOL_SIZE, thread_name_prefix="workspace-io"
+    )
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(executor)
+    await asyncio.to_thread(warm_office_extraction_pool)
+    try:
+        yield
+    finally:
+        await close_http_client()
+        await asyncio.to_thread(shutdown_office_extraction_pool)
+        # Waits for in-flight to_thread work instead of failing it mid-call
+        await loop.shutdown_default_executor()
+
+
 server = SecureFastMCP(
     name="google_workspace",
     auth=None,
+    lifespan=server_lifespan,
 )
 
 # Add the AuthInfo middleware to inject authentication into FastMCP context
@@ -1,5 +1,6 @@
 import io
 import logging
+import multiprocessing
 import os
 import zipfile
 import xml.etree.ElementTree as ET
@@ -7,8 +8,10 @@ import ssl
 import asyncio
 import functools
 
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterator, List, Optional, Tuple, Union
 
+import httpx
 from googleapiclient.errors import HttpError
 from .api_enablement import get_api_enablement_message
 from auth.google_auth import GoogleAuthenticationError
@@ -91,17 +94,130 @@ def check_credentials_directory_permissions(credentials_dir: str = None) -> None
         )
 
 
+OFFICE_XML_MIME_TYPES = frozenset(
+    {
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+)
+
+# Bytes that occur in text: printable ASCII, common control codes, and all
+# high bytes (UTF-8 multi-byte sequences)
+_TEXT_BYTES = bytes({7, 8, 9, 10, 11, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+BINARY_SNIFF_BYTES = 4096
+BINARY_CONTROL_RATIO = 0.3
+
+OFFICE_EXTRACTION_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+_office_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+
+def looks_like_binary(data: bytes) -> bool:
+    """
+    Cheaply guess whether content is binary by sampling its first few KB.
+
+    A NUL byte, or a high share of control bytes, marks the content as binary,
+    so callers can skip a full UTF-8 decode that would fail anyway.
+    """
+    sample = bytes(data[:BINARY_SNIFF_BYTES])
+    if not sample:
+        return False
+    if b"\x00" in sample:
+        return True
+    non_text = len(sample.translate(None, _TEXT_BYTES))
+    return non_text / len(sample) > BINARY_CONTROL_RATIO
+
+
 def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
     """
     Very light-weight XML scraper for Word, Excel, PowerPoint files.
     Returns plain-text if something readable is found, else None.
     No external deps – just std-lib zipfile + ElementTree.
     """
+    if mime_type not in OFFICE_XML_MIME_TYPES:
+        # Skip wrapping and unzipping content that can't be Office XML
+        return None
+    return _extract_office_xml_text(io.BytesIO(file_bytes), mime_type)
+
+
+def extract_office_xml_text_from_path(file_path: str, mime_type: str) -> Optional[str]:
+    """
+    Same as extract_office_xml_text, but reads the archive from a file on disk.
+
+    Only the path crosses process boundaries, so this is the variant to run in
+    the office extraction process pool.
+    """
+    if mime_type not in OFFICE_XML_MIME_TYPES:
+        return None
+    return _extract_office_xml_text(file_path, mime_type)
+
+
+def get_office_extraction_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool for CPU-bound Office XML extraction, creating it on
+    first use so worker processes are only started when needed.
+    """
+    global _office_extraction_pool
+    if _office_extraction_pool is None:
+        # Spawned rather than forked: the server process runs several threads,
+        # and a forked child could inherit one of their locks held forever
+        _office_extraction_pool = ProcessPoolExecutor(
+            max_workers=OFFICE_EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _office_extraction_pool
+
+
+def warm_office_extraction_pool() -> None:
+    """
+    Start every Office extraction worker process now, so the first extraction
+    doesn't wait for a worker to start up.
+    """
+    pool = get_office_extraction_pool()
+    # Workers are started on demand, one per task that finds none idle
+    for _ in range(OFFICE_EXTRACTION_WORKERS):
+        pool.submit(os.getpid)
+
+
+def shutdown_office_extraction_pool() -> None:
+    """Stop the Office extraction worker processes, if any were started."""
+    global _office_extraction_pool
+    if _office_extraction_pool is not None:
+        _office_extraction_pool.shutdown(wait=True, cancel_futures=True)
+        _office_extraction_pool = None
+
+
+def _iter_closed_xml_elements(
+    stream: IO[bytes],
+) -> Iterator[Tuple[ET.Element, Optional[ET.Element]]]:
+    """
+    Incrementally parse XML, yielding (element, parent) as each element closes.
+
+    Finished siblings are detached from their parent after being yielded, so
+    memory stays at roughly one element path instead of the whole document.
+    """
+    open_elements: List[ET.Element] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            continue
+        open_elements.pop()
+        parent = open_elements[-1] if open_elements else None
+        yield elem, parent
+        if parent is not None:
+            # Everything inside parent so far has closed and been handled
+            del parent[:]
+
+
+def _extract_office_xml_text(
+    source: Union[str, IO[bytes]], mime_type: str
+) -> Optional[str]:
+    """Extract text from an Office XML archive given as a path or file object."""
     shared_strings: List[str] = []
     ns_excel_main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
 
     try:
-        with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
+        with zipfile.ZipFile(source) as zf:
             targets: List[str] = []
             # Map MIME → iterable of XML files to inspect
             if (
@@ -125,17 +241,18 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
                 ]
                 # Attempt to parse sharedStrings.xml for Excel files
                 try:
-                    shared_strings_xml = zf.read("xl/sharedStrings.xml")
-                    shared_strings_root = ET.fromstring(shared_strings_xml)
-                    for si_element in shared_strings_root.findall(
-                        f"{{{ns_excel_main}}}si"
-                    ):
-                        text_parts = []
-                        # Find all <t> elements, simple or within <r> runs, and concatenate their text
-                        for t_element in si_element.findall(f".//{{{ns_excel_main}}}t"):
-                            if t_element.text:
-                                text_parts.append(t_element.text)
-                        shared_strings.append("".join(text_parts))
+                    si_tag = f"{{{ns_excel_main}}}si"
+                    t_tag = f"{{{ns_excel_main}}}t"
+                    text_parts: List[str] = []
+                    with zf.open("xl/sharedStrings.xml") as shared_strings_xml:
+                        # Concatenate all <t> elements, simple or within <r> runs
+                        for elem, _ in _iter_closed_xml_elements(shared_strings_xml):
+                            if elem.tag == t_tag:
+                                if elem.text:
+                                    text_parts.append(elem.text)
+                            elif elem.tag == si_tag:
+                                shared_strings.append("".join(text_parts))
+                                text_parts = []
                 except KeyError:
                     logger.info(
                         "No sharedStrings.xml found in Excel file (this is optional)."
@@ -155,46 +272,46 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
             pieces: List[str] = []
             for member in targets:
                 try:
-                    xml_content = zf.read(member)
-                    xml_root = ET.fromstring(xml_content)
                     member_texts: List[str] = []
-
-                    if (
+                    is_sheet = (
                         mime_type
                         == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    ):
-                        for cell_element in xml_root.findall(
-                            f".//{{{ns_excel_main}}}c"
-                        ):  # Find all <c> elements
-                            value_element = cell_element.find(
-                                f"{{{ns_excel_main}}}v"
-                            )  # Find <v> under <c>
-
-                            # Skip if cell has no value element or value element has no text
-                            if value_element is None or value_element.text is None:
-                                continue
-
-                            cell_type = cell_element.get("t")
-                            if cell_type == "s":  # Shared string
-                                try:
-                                    ss_idx = int(value_element.text)
-                                    if 0 <= ss_idx < len(shared_strings):
-                                        member_texts.append(shared_strings[ss_idx])
-                                    else:
+                    )
+                    with zf.open(member) as xml_stream:
+                        for elem, parent in _iter_closed_xml_elements(xml_stream):
+                            if is_sheet:
+                                # Cell values are <v> elements under <c>
+                                if (
+                                    elem.tag != f"{{{ns_excel_main}}}v"
+                                    or parent is None
+                                    or parent.tag != f"{{{ns_excel_main}}}c"
+                                ):
+                                    continue
+
+                                # Skip if value element has no text
+                                if elem.text is None:
+                                    continue
+
+                                cell_type = parent.get("t")
+                                if cell_type == "s":  # Shared string
+                                    try:
+                                        ss_idx = int(elem.text)
+                                        if 0 <= ss_idx < len(shared_strings):
+                                            member_texts.append(shared_strings[ss_idx])
+                                        else:
+                                            logger.warning(
+                                                f"Invalid shared string index {ss_idx} in {member}. Max index: {len(shared_strings) - 1}"
+                                            )
+                                    except ValueError:
                                         logger.warning(
-                                            f"Invalid shared string index {ss_idx} in {member}. Max index: {len(shared_strings) - 1}"
+                                            f"Non-integer shared string index: '{elem.text}' in {member}."
                                         )
-                                except ValueError:
-                                    logger.warning(
-                                        f"Non-integer shared string index: '{value_element.text}' in {member}."
-                                    )
-                            else:  # Direct value (number, boolean, inline string if not 's')
-                                member_texts.append(value_element.text)
-                    else:  # Word or PowerPoint
-                        for elem in xml_root.iter():
+                                else:  # Direct value (number, boolean, inline string if not 's')
+                                    member_texts.append(elem.text)
+                            # Word or PowerPoint
                             # For Word: <w:t> where w is "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
                             # For PowerPoint: <a:t> where a is "http://schemas.openxmlformats.org/drawingml/2006/main"
-                            if (
+                            elif (
                                 elem.tag.endswith("}t") and elem.text
                             ):  # Check for any namespaced tag ending with 't'
                                 cleaned_text = elem.text.strip()
@@ -251,7 +368,9 @@ def handle_http_errors(
     and raises a generic Exception with a user-friendly message.
 
     If is_read_only is True, it will also catch ssl.SSLError and retry with
-    exponential backoff. After exhausting retries, it raises a TransientNetworkError.
+    exponential backoff. httpx.TransportError, which wraps SSL and connection
+    failures on direct REST calls, is retried the same way. After exhausting
+    retries, it raises a TransientNetworkError.
 
     Args:
         tool_name (str): The name of the tool being decorated (e.g., 'list_calendars').
@@ -269,19 +388,19 @@ def handle_http_errors(
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
-                except ssl.SSLError as e:
+                except (ssl.SSLError, httpx.TransportError) as e:
                     if is_read_only and attempt < max_retries - 1:
                         delay = base_delay * (2**attempt)
                         logger.warning(
-                            f"SSL error in {tool_name} on attempt {attempt + 1}: {e}. Retrying in {delay} seconds..."
+                            f"SSL or network error in {tool_name} on attempt {attempt + 1}: {e}. Retrying in {delay} seconds..."
                         )
                         await asyncio.sleep(delay)
                     else:
                         logger.error(
-                            f"SSL error in {tool_name} on final attempt: {e}. Raising exception."
+                            f"SSL or network error in {tool_name} on final attempt: {e}. Raising exception."
                         )
                         raise TransientNetworkError(
-                            f"A transient SSL error occurred in '{tool_name}' after {max_retries} attempts. "
+                            f"A transient SSL or network error occurred in '{tool_name}' after {max_retries} attempts. "
                             "This is likely a temporary network or certificate issue. Please try again shortly."
                         ) from e
                 except UserInputError as e:
@@ -13,8 +13,9 @@ from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 
 # Auth & server utilities
 from auth.service_decorator import require_google_service, require_multiple_services
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import extract_office_xml_text, handle_http_errors, looks_like_binary
 from core.server import server
+from core.config import DOWNLOAD_CHUNK_SIZE_BYTES
 from core.comments import create_comment_tools
 
 # Import helper functions for document operations
@@ -249,25 +250,30 @@ async def get_doc_content(
         )
 
         fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request_obj)
-        loop = asyncio.get_event_loop()
+        downloader = MediaIoBaseDownload(
+            fh, request_obj, chunksize=DOWNLOAD_CHUNK_SIZE_BYTES
+        )
         done = False
         while not done:
-            status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-        file_content_bytes = fh.getvalue()
+            status, done = await asyncio.to_thread(downloader.next_chunk)
 
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
-        if office_text:
-            body_text = office_text
-        else:
-            try:
-                body_text = file_content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                body_text = (
-                    f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                    f"{len(file_content_bytes)} bytes]"
-                )
+        # Work on the download buffer in place instead of copying it to bytes
+        with fh.getbuffer() as file_content:
+            office_text = extract_office_xml_text(file_content, mime_type)
+            if office_text:
+                body_text = office_text
+            else:
+                body_text = None
+                if not looks_like_binary(file_content):
+                    try:
+                        body_text = str(file_content, "utf-8")
+                    except UnicodeDecodeError:
+                        pass
+                if body_text is None:
+                    body_text = (
+                        f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
+                        f"{file_content.nbytes} bytes]"
+                    )
 
     header = (
         f'File: "{file_name}" (ID: {document_id}, Type: {mime_type})\n'
@@ -1264,14 +1270,15 @@ async def export_doc_to_pdf(
         )
 
         fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request_obj)
+        downloader = MediaIoBaseDownload(
+            fh, request_obj, chunksize=DOWNLOAD_CHUNK_SIZE_BYTES
+        )
 
         done = False
         while not done:
             _, done = await asyncio.to_thread(downloader.next_chunk)
 
-        pdf_content = fh.getvalue()
-        pdf_size = len(pdf_content)
+        pdf_size = fh.getbuffer().nbytes
 
     except Exception as e:
         return f"Error: Failed to export document to PDF: {str(e)}"
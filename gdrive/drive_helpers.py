@@ -5,11 +5,23 @@ Shared utilities for Google Drive operations including permission checking.
 """
 
 import asyncio
+import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import socket
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httplib2
+from google.auth.exceptions import TransportError
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
 
 VALID_SHARE_ROLES = {"reader", "commenter", "writer"}
 VALID_SHARE_TYPES = {"user", "group", "domain", "anyone"}
+# Roles that make an 'anyone' permission a working public link
+PUBLIC_LINK_ROLES = frozenset({"reader", "commenter", "writer"})
 
 
 def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
@@ -23,7 +35,7 @@ def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
         bool: True if file has public link sharing enabled
     """
     return any(
-        p.get("type") == "anyone" and p.get("role") in ["reader", "writer", "commenter"]
+        p.get("type") == "anyone" and p.get("role") in PUBLIC_LINK_ROLES
         for p in permissions
     )
 
@@ -113,6 +125,15 @@ def validate_expiration_time(expiration_time: str) -> None:
         )
 
 
+# Display label and the field naming the grantee, keyed by permission type
+_PERMISSION_SUBJECTS = {
+    "anyone": ("Anyone with the link", None),
+    "user": ("User", "emailAddress"),
+    "group": ("Group", "emailAddress"),
+    "domain": ("Domain", "domain"),
+}
+
+
 def format_permission_info(permission: Dict[str, Any]) -> str:
     """
     Format a permission object for display.
@@ -123,37 +144,33 @@ def format_permission_info(permission: Dict[str, Any]) -> str:
     Returns:
         str: Human-readable permission description with ID
     """
-    perm_type = permission.get("type", "unknown")
-    role = permission.get("role", "unknown")
-    perm_id = permission.get("id", "")
-
-    if perm_type == "anyone":
-        base = f"Anyone with the link ({role}) [id: {perm_id}]"
-    elif perm_type == "user":
-        email = permission.get("emailAddress", "unknown")
-        base = f"User: {email} ({role}) [id: {perm_id}]"
-    elif perm_type == "group":
-        email = permission.get("emailAddress", "unknown")
-        base = f"Group: {email} ({role}) [id: {perm_id}]"
-    elif perm_type == "domain":
-        domain = permission.get("domain", "unknown")
-        base = f"Domain: {domain} ({role}) [id: {perm_id}]"
-    else:
-        base = f"{perm_type} ({role}) [id: {perm_id}]"
-
-    extras = []
-    if permission.get("expirationTime"):
-        extras.append(f"expires: {permission['expirationTime']}")
+    get = permission.get
+    perm_type = get("type", "unknown")
+    role = get("role", "unknown")
+    perm_id = get("id", "")
 
-    perm_details = permission.get("permissionDetails", [])
-    if perm_details:
-        for detail in perm_details:
-            if detail.get("inherited") and detail.get("inheritedFrom"):
-                extras.append(f"inherited from: {detail['inheritedFrom']}")
-                break
-
-    if extras:
-        return f"{base} | {', '.join(extras)}"
+    subject = _PERMISSION_SUBJECTS.get(perm_type)
+    if subject is None:
+        base = f"{perm_type} ({role}) [id: {perm_id}]"
+    else:
+        label, subject_field = subject
+        if subject_field is not None:
+            label = f"{label}: {get(subject_field, 'unknown')}"
+        base = f"{label} ({role}) [id: {perm_id}]"
+
+    expiration_time = get("expirationTime")
+    inherited_from = None
+    for detail in get("permissionDetails") or ():
+        if detail.get("inherited") and detail.get("inheritedFrom"):
+            inherited_from = detail["inheritedFrom"]
+            break
+
+    if expiration_time and inherited_from:
+        return f"{base} | expires: {expiration_time}, inherited from: {inherited_from}"
+    if expiration_time:
+        return f"{base} | expires: {expiration_time}"
+    if inherited_from:
+        return f"{base} | inherited from: {inherited_from}"
     return base
 
 
@@ -174,6 +191,35 @@ DRIVE_QUERY_PATTERNS = [
     re.compile(r"\bmimeType\s*(=|!=)\b", re.IGNORECASE),  # mimeType operators
 ]
 
+# Single alternation of all patterns so detection is one pass over the query
+DRIVE_QUERY_COMBINED = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in DRIVE_QUERY_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Backslashes and single quotes must be escaped inside quoted query values
+_DRIVE_QUERY_ESCAPE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+
+
+def escape_drive_query_value(value: str) -> str:
+    """
+    Escape a value for use inside a single-quoted Drive query string.
+
+    Args:
+        value: Raw value, e.g. a file name or free text search term
+
+    Returns:
+        str: Value with backslashes and single quotes escaped
+    """
+    return value.translate(_DRIVE_QUERY_ESCAPE)
+
+
+DEFAULT_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, webViewLink, iconLink, modifiedTime, size)"
+# Only the fields rendered by the file listing tools
+FILE_LISTING_FIELDS = (
+    "nextPageToken, files(id, name, mimeType, size, modifiedTime, webViewLink)"
+)
+
 
 def build_drive_list_params(
     query: str,
@@ -181,6 +227,7 @@ def build_drive_list_params(
     drive_id: Optional[str] = None,
     include_items_from_all_drives: bool = True,
     corpora: Optional[str] = None,
+    fields: str = DEFAULT_LIST_FIELDS,
 ) -> Dict[str, Any]:
     """
     Helper function to build common list parameters for Drive API calls.
@@ -191,6 +238,7 @@ def build_drive_list_params(
         drive_id: Optional shared drive ID
         include_items_from_all_drives: Whether to include items from all drives
         corpora: Optional corpus specification
+        fields: Partial-response field mask for the list call
 
     Returns:
         Dictionary of parameters for Drive API list calls
@@ -198,7 +246,7 @@ def build_drive_list_params(
     list_params = {
         "q": query,
         "pageSize": page_size,
-        "fields": "nextPageToken, files(id, name, mimeType, webViewLink, iconLink, modifiedTime, size)",
+        "fields": fields,
         "supportsAllDrives": True,
         "includeItemsFromAllDrives": include_items_from_all_drives,
     }
@@ -215,8 +263,35 @@ def build_drive_list_params(
     return list_params
 
 
+# Maximum number of sub-requests Drive accepts in a single batch call
+DRIVE_BATCH_LIMIT = 100
+
+# Failures raised before a batch reaches Drive, so none of its requests ran
+BATCH_NOT_SENT_ERRORS = (
+    httplib2.ServerNotFoundError,
+    ConnectionRefusedError,
+    socket.gaierror,
+    TransportError,
+)
+
+# Folder shortcut resolutions are cached per user for a short time
+FOLDER_CACHE_TTL_SECONDS = 300
+FOLDER_CACHE_MAX_ENTRIES = 4096
+_folder_id_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
+# Name lookups for public-access checks are cached per user for a short time.
+# update_drive_file, remove_drive_permission and transfer_drive_ownership drop
+# the entries for the file they change; other changes show up once the entry
+# expires.
+FILE_LOOKUP_CACHE_TTL_SECONDS = 60
+FILE_LOOKUP_CACHE_MAX_ENTRIES = 1024
+_file_lookup_cache: "OrderedDict[Tuple[str, str], Tuple[float, frozenset, Any]]" = (
+    OrderedDict()
+)
+
 SHORTCUT_MIME_TYPE = "application/vnd.google-apps.shortcut"
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+ROOT_FOLDER_ID = "root"
 BASE_SHORTCUT_FIELDS = (
     "id, mimeType, parents, shortcutDetails(targetId, targetMimeType)"
 )
@@ -241,11 +316,10 @@ async def resolve_drive_item(
     if extra_fields:
         fields = f"{fields}, {extra_fields}"
 
+    files = service.files()
     while True:
         metadata = await asyncio.to_thread(
-            service.files()
-            .get(fileId=current_id, fields=fields, supportsAllDrives=True)
-            .execute
+            files.get(fileId=current_id, fields=fields, supportsAllDrives=True).execute
         )
         mime_type = metadata.get("mimeType")
         if mime_type != SHORTCUT_MIME_TYPE:
@@ -264,15 +338,118 @@ async def resolve_drive_item(
         current_id = target_id
 
 
+def _get_cached_folder_id(cache_key: Tuple[str, str]) -> Optional[str]:
+    """Return a resolved folder ID from the cache if present and not expired."""
+    entry = _folder_id_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, resolved_id = entry
+    if time.monotonic() > expires_at:
+        del _folder_id_cache[cache_key]
+        return None
+    _folder_id_cache.move_to_end(cache_key)
+    return resolved_id
+
+
+def _cache_folder_id(cache_key: Tuple[str, str], resolved_id: str) -> None:
+    """Store a resolved folder ID, evicting the least recently used entries."""
+    _folder_id_cache[cache_key] = (
+        time.monotonic() + FOLDER_CACHE_TTL_SECONDS,
+        resolved_id,
+    )
+    _folder_id_cache.move_to_end(cache_key)
+    while len(_folder_id_cache) > FOLDER_CACHE_MAX_ENTRIES:
+        _folder_id_cache.popitem(last=False)
+
+
+def remember_folder_ids(user_email: str, folder_ids: Iterable[str]) -> None:
+    """
+    Cache IDs already known to name real folders (not shortcuts), so using
+    one of them as a parent right after needs no lookup.
+    """
+    for folder_id in folder_ids:
+        _cache_folder_id((user_email, folder_id), folder_id)
+
+
+def get_cached_file_lookup(user_email: str, file_name: str) -> Optional[Any]:
+    """Return a cached name lookup for the user if present and not expired."""
+    cache_key = (user_email, file_name)
+    entry = _file_lookup_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, _, lookup = entry
+    if time.monotonic() > expires_at:
+        del _file_lookup_cache[cache_key]
+        return None
+    _file_lookup_cache.move_to_end(cache_key)
+    return lookup
+
+
+def cache_file_lookup(
+    user_email: str, file_name: str, file_ids: List[str], lookup: Any
+) -> None:
+    """
+    Store a name lookup, evicting the least recently used entries.
+
+    file_ids lists every Drive item the lookup describes, so a later write to
+    any of them can invalidate it.
+    """
+    cache_key = (user_email, file_name)
+    _file_lookup_cache[cache_key] = (
+        time.monotonic() + FILE_LOOKUP_CACHE_TTL_SECONDS,
+        frozenset(file_ids),
+        lookup,
+    )
+    _file_lookup_cache.move_to_end(cache_key)
+    while len(_file_lookup_cache) > FILE_LOOKUP_CACHE_MAX_ENTRIES:
+        _file_lookup_cache.popitem(last=False)
+
+
+def invalidate_file_lookups(
+    file_id: Optional[str] = None,
+    *,
+    user_email: Optional[str] = None,
+    file_name: Optional[str] = None,
+) -> None:
+    """
+    Drop cached name lookups that mention file_id, or the lookup for
+    (user_email, file_name), after the underlying item may have changed.
+    """
+    if user_email is not None and file_name is not None:
+        _file_lookup_cache.pop((user_email, file_name), None)
+    if file_id is not None:
+        stale_keys = [
+            cache_key
+            for cache_key, (_, file_ids, _) in _file_lookup_cache.items()
+            if file_id in file_ids
+        ]
+        for cache_key in stale_keys:
+            del _file_lookup_cache[cache_key]
+
+
 async def resolve_folder_id(
     service,
     folder_id: str,
     *,
     max_depth: int = 5,
+    user_email: Optional[str] = None,
 ) -> str:
     """
     Resolve a folder ID that might be a shortcut and ensure the final target is a folder.
+
+    When user_email is given, successful resolutions are cached per user for
+    FOLDER_CACHE_TTL_SECONDS, since a folder ID keeps naming the same folder.
     """
+    if folder_id == ROOT_FOLDER_ID:
+        # The 'root' alias always names the user's My Drive folder
+        return folder_id
+
+    cache_key = (user_email, folder_id) if user_email else None
+    if cache_key:
+        cached_id = _get_cached_folder_id(cache_key)
+        if cached_id:
+            return cached_id
+
     resolved_id, metadata = await resolve_drive_item(
         service,
         folder_id,
@@ -283,4 +460,228 @@ async def resolve_folder_id(
         raise Exception(
             f"Resolved ID '{resolved_id}' (from '{folder_id}') is not a folder; mimeType={mime_type}."
         )
+    if cache_key:
+        _cache_folder_id(cache_key, resolved_id)
     return resolved_id
+
+
+async def execute_batch_requests(
+    service,
+    requests: List[Tuple[str, Any]],
+    *,
+    fallback_concurrency: Optional[int] = None,
+) -> Dict[str, Union[Dict[str, Any], Exception]]:
+    """
+    Execute API requests through Drive batch requests.
+
+    Takes (request_id, HttpRequest) pairs with unique request IDs. Up to
+    DRIVE_BATCH_LIMIT requests share one HTTP round trip. Returns a mapping of
+    request ID to its response, or to the exception raised for that
+    sub-request.
+
+    A batch call that fails as a whole raises, unless fallback_concurrency is
+    set. Then a failure that happened before the batch was sent is retried as
+    individual requests, up to fallback_concurrency at a time; any other
+    failure is recorded for every request in the chunk, since some of them may
+    already have been applied and requests such as permission creates must not
+    be replayed.
+    """
+    results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+
+    def _collect(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    for start in range(0, len(requests), DRIVE_BATCH_LIMIT):
+        chunk = requests[start : start + DRIVE_BATCH_LIMIT]
+        batch = service.new_batch_http_request(callback=_collect)
+        for request_id, request in chunk:
+            batch.add(request, request_id=request_id)
+        try:
+            await asyncio.to_thread(batch.execute)
+        except Exception as e:
+            if fallback_concurrency is None:
+                raise
+            unanswered = [
+                (request_id, request)
+                for request_id, request in chunk
+                if request_id not in results
+            ]
+            if isinstance(e, BATCH_NOT_SENT_ERRORS):
+                logger.warning(
+                    "Drive batch request could not be sent (%s); "
+                    "sending %d requests individually",
+                    e,
+                    len(unanswered),
+                )
+                results.update(
+                    await execute_requests_concurrently(
+                        unanswered, fallback_concurrency
+                    )
+                )
+            else:
+                logger.warning(
+                    "Drive batch request failed (%s); reporting %d requests as failed",
+                    e,
+                    len(unanswered),
+                )
+                for request_id, _ in unanswered:
+                    results[request_id] = e
+
+    return results
+
+
+async def execute_requests_concurrently(
+    requests: List[Tuple[str, Any]],
+    concurrency: int,
+) -> Dict[str, Union[Dict[str, Any], Exception]]:
+    """
+    Execute API requests individually, with up to concurrency in flight.
+
+    Returns the same mapping as execute_batch_requests. HTTP errors and
+    connection failures are recorded per request rather than raised. Each
+    request runs on its own worker thread, and the shared transport keeps one
+    connection per thread.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _execute(request) -> Union[Dict[str, Any], Exception]:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(request.execute)
+            except (HttpError, *BATCH_NOT_SENT_ERRORS) as e:
+                return e
+
+    responses = await asyncio.gather(*(_execute(request) for _, request in requests))
+    return {
+        request_id: response for (request_id, _), response in zip(requests, responses)
+    }
+
+
+async def batch_get_drive_items(
+    service,
+    file_ids: List[str],
+    fields: str,
+) -> Dict[str, Union[Dict[str, Any], Exception]]:
+    """
+    Fetch metadata for several files using Drive batch requests.
+
+    Returns a mapping of file ID to its metadata, or to the exception raised
+    for that sub-request.
+    """
+    files = service.files()
+    return await execute_batch_requests(
+        service,
+        [
+            (
+                file_id,
+                files.get(fileId=file_id, fields=fields, supportsAllDrives=True),
+            )
+            for file_id in dict.fromkeys(file_ids)
+        ],
+    )
+
+
+async def batch_resolve_drive_items(
+    service,
+    file_ids: List[str],
+    *,
+    extra_fields: Optional[str] = None,
+    max_depth: int = 5,
+) -> Dict[str, Union[Tuple[str, Dict[str, Any]], Exception]]:
+    """
+    Batched counterpart of resolve_drive_item for many files at once.
+
+    Each shortcut hop costs one batch round trip for all pending items instead of
+    one request per file. Returns a mapping of each requested ID to a
+    (resolved_id, metadata) tuple, or to the exception for that item.
+    """
+    fields = BASE_SHORTCUT_FIELDS
+    if extra_fields:
+        fields = f"{fields}, {extra_fields}"
+
+    requested_ids = list(dict.fromkeys(file_ids))
+    resolved: Dict[str, Union[Tuple[str, Dict[str, Any]], Exception]] = {}
+    # Maps requested ID -> ID to fetch next
+    pending = {file_id: file_id for file_id in requested_ids}
+    depth = 0
+
+    while pending:
+        fetched = await batch_get_drive_items(service, list(pending.values()), fields)
+        next_pending = {}
+        for original_id, current_id in pending.items():
+            outcome = fetched[current_id]
+            if isinstance(outcome, Exception):
+                resolved[original_id] = outcome
+            elif outcome.get("mimeType") != SHORTCUT_MIME_TYPE:
+                resolved[original_id] = (current_id, outcome)
+            else:
+                target_id = (outcome.get("shortcutDetails") or {}).get("targetId")
+                if target_id:
+                    next_pending[original_id] = target_id
+                else:
+                    resolved[original_id] = Exception(
+                        f"Shortcut '{current_id}' is missing target details."
+                    )
+
+        depth += 1
+        if next_pending and depth > max_depth:
+            for original_id in next_pending:
+                resolved[original_id] = Exception(
+                    f"Shortcut resolution exceeded {max_depth} hops starting from '{original_id}'."
+                )
+            break
+        pending = next_pending
+
+    # Preserve the caller's ordering
+    return {file_id: resolved[file_id] for file_id in requested_ids}
+
+
+async def resolve_folder_ids(
+    service,
+    folder_ids: List[str],
+    *,
+    user_email: Optional[str] = None,
+    max_depth: int = 5,
+) -> List[str]:
+    """
+    Resolve several folder IDs at once, in the same order as given.
+
+    Cached and 'root' IDs need no request; the rest are resolved together in
+    batch requests rather than one round trip each. Raises on the first ID
+    that fails to resolve or is not a folder, like resolve_folder_id.
+    """
+    resolved: Dict[str, str] = {}
+    pending: List[str] = []
+    for folder_id in dict.fromkeys(folder_ids):
+        cached_id = (
+            _get_cached_folder_id((user_email, folder_id)) if user_email else None
+        )
+        if folder_id == ROOT_FOLDER_ID:
+            resolved[folder_id] = folder_id
+        elif cached_id:
+            resolved[folder_id] = cached_id
+        else:
+            pending.append(folder_id)
+
+    if len(pending) == 1:
+        resolved[pending[0]] = await resolve_folder_id(
+            service, pending[0], user_email=user_email, max_depth=max_depth
+        )
+    elif pending:
+        outcomes = await batch_resolve_drive_items(
+            service, pending, max_depth=max_depth
+        )
+        for folder_id, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                raise outcome
+            resolved_id, metadata = outcome
+            mime_type = metadata.get("mimeType")
+            if mime_type != FOLDER_MIME_TYPE:
+                raise Exception(
+                    f"Resolved ID '{resolved_id}' (from '{folder_id}') is not a folder; mimeType={mime_type}."
+                )
+            if user_email:
+                _cache_folder_id((user_email, folder_id), resolved_id)
+            resolved[folder_id] = resolved_id
+
+    return [resolved[folder_id] for folder_id in folder_ids]
@@ -7,32 +7,67 @@ This module provides MCP tools for interacting with Google Drive API.
 import asyncio
 import logging
 import io
+import mmap
+import os
 import httpx
+import httplib2
 import base64
 
-from typing import Optional, List, Dict, Any
+from contextlib import AsyncExitStack
+from itertools import chain
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple
 from tempfile import NamedTemporaryFile
-from urllib.parse import urlparse
+from urllib.parse import quote, urlencode, urlsplit
 from urllib.request import url2pathname
 from pathlib import Path
 
+import google_auth_httplib2
+from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from googleapiclient.http import MediaInMemoryUpload, MediaIoBaseUpload, MediaUpload
 
+try:
+    import orjson
+except ImportError:  # Optional; direct REST calls fall back to httpx's json handling
+    orjson = None
+
+from auth.google_auth import get_service_credentials
 from auth.service_decorator import require_google_service
 from auth.oauth_config import is_stateless_mode
 from core.attachment_storage import get_attachment_storage, get_attachment_url
-from core.utils import extract_office_xml_text, handle_http_errors
+from core.utils import (
+    OFFICE_XML_MIME_TYPES,
+    extract_office_xml_text_from_path,
+    get_office_extraction_pool,
+    handle_http_errors,
+    looks_like_binary,
+)
 from core.server import server
-from core.config import get_transport_mode
+from core.config import (
+    DOWNLOAD_CHUNK_SIZE_BYTES,
+    DRIVE_SHARE_CONCURRENCY,
+    get_transport_mode,
+)
+from core.http_client import get_google_http, get_http_client
 from gdrive.drive_helpers import (
-    DRIVE_QUERY_PATTERNS,
+    DRIVE_QUERY_COMBINED,
+    FILE_LISTING_FIELDS,
+    FOLDER_MIME_TYPE,
+    SHORTCUT_MIME_TYPE,
+    batch_resolve_drive_items,
     build_drive_list_params,
+    cache_file_lookup,
     check_public_link_permission,
+    escape_drive_query_value,
+    execute_batch_requests,
     format_permission_info,
+    get_cached_file_lookup,
     get_drive_image_url,
+    invalidate_file_lookups,
+    remember_folder_ids,
     resolve_drive_item,
     resolve_folder_id,
+    resolve_folder_ids,
     validate_expiration_time,
     validate_share_role,
     validate_share_type,
@@ -40,8 +75,351 @@ from gdrive.drive_helpers import (
 
 logger = logging.getLogger(__name__)
 
-DOWNLOAD_CHUNK_SIZE_BYTES = 256 * 1024  # 256 KB
 UPLOAD_CHUNK_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB (Google recommended minimum)
+UPLOAD_QUEUE_MAX_CHUNKS = 8  # Download chunks buffered ahead of the upload
+DOWNLOAD_QUEUE_MAX_CHUNKS = 8  # Download chunks buffered ahead of the disk writer
+DOWNLOAD_PREVIEW_BYTES = 100  # Base64 preview shown in stateless mode
+
+# Base URL for direct Drive REST calls made outside the API client
+DRIVE_API_BASE_URL = "https://www.googleapis.com/drive/v3/"
+
+# Google APIs only gzip responses when the User-Agent mentions gzip
+GZIP_USER_AGENT_SUFFIX = " (gzip)"
+
+FILE_PERMISSIONS_FIELDS = (
+    "name, size, modifiedTime, "
+    "permissions(id, type, role, emailAddress, domain, expirationTime, permissionDetails), "
+    "webViewLink, webContentLink, shared, sharingUser"
+)
+# Permission type and role are all the public-access check reads
+PUBLIC_ACCESS_FIELDS = "name, shared, permissions(type, role)"
+BULK_PERMISSIONS_FIELDS = (
+    "name, shared, "
+    "permissions(id, type, role, emailAddress, domain, expirationTime, permissionDetails)"
+)
+
+# (Google native mimeType, export_format) -> (export mimeType, file extension);
+# the None entry is the default format for that file type
+GOOGLE_EXPORT_FORMATS = {
+    ("application/vnd.google-apps.document", "docx"): (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ".docx",
+    ),
+    ("application/vnd.google-apps.document", None): ("application/pdf", ".pdf"),
+    ("application/vnd.google-apps.spreadsheet", "csv"): ("text/csv", ".csv"),
+    ("application/vnd.google-apps.spreadsheet", None): (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ".xlsx",
+    ),
+    ("application/vnd.google-apps.presentation", "pptx"): (
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        ".pptx",
+    ),
+    ("application/vnd.google-apps.presentation", None): ("application/pdf", ".pdf"),
+}
+
+
+_format_file_line = (
+    '- Name: "{name}" (ID: {id}, Type: {mimeType}{size}, '
+    "Modified: {modifiedTime}) Link: {webViewLink}"
+).format
+
+
+def _format_file_listing(header: str, files: List[Dict[str, Any]]) -> str:
+    """
+    Render a listing header followed by one line per file, joined in one pass.
+    """
+    lines = (
+        _format_file_line(
+            name=item["name"],
+            id=item["id"],
+            mimeType=item["mimeType"],
+            size=f", Size: {item['size']}" if "size" in item else "",
+            modifiedTime=item.get("modifiedTime", "N/A"),
+            webViewLink=item.get("webViewLink", "#"),
+        )
+        for item in files
+    )
+    return "\n".join(chain((header,), lines))
+
+
+def _ensure_ext(name: str, ext: str) -> str:
+    """
+    Return name with its extension replaced by ext, unless it already has it.
+
+    Drive names may contain '/', so only the final component is kept; the
+    result is used as a download or attachment file name.
+    """
+    name = Path(name).name
+    root, current = os.path.splitext(name)
+    return name if current.lower() == ext else root + ext
+
+
+def _get_auth_headers(credentials: Credentials, uri: str) -> Dict[str, str]:
+    """
+    Build request headers carrying the given OAuth credentials.
+
+    Refreshes the access token first if it has expired. Blocking; call via
+    asyncio.to_thread.
+    """
+    headers: Dict[str, str] = {}
+    credentials.before_request(
+        google_auth_httplib2.Request(get_google_http()), "GET", uri, headers
+    )
+    return headers
+
+
+def _http_error(resp, content: bytes, url: str) -> HttpError:
+    """
+    Wrap a failed direct REST response in the HttpError the API client raises.
+    """
+    return HttpError(
+        httplib2.Response(
+            {
+                "status": resp.status_code,
+                "content-type": resp.headers.get("Content-Type", ""),
+            }
+        ),
+        content,
+        uri=url,
+    )
+
+
+async def _post_drive_json(
+    credentials: Credentials, path: str, params: Dict[str, Any], body: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    POST a JSON body to a Drive REST endpoint and return the parsed response.
+
+    Goes through the shared async HTTP client rather than the API client, so
+    no worker thread is held for the round trip.
+    """
+    url = f"{DRIVE_API_BASE_URL}{path}"
+    headers = await asyncio.to_thread(_get_auth_headers, credentials, url)
+    client = get_http_client()
+    if orjson is not None:
+        headers["content-type"] = "application/json"
+        resp = await client.post(
+            url, params=params, content=orjson.dumps(body), headers=headers
+        )
+    else:
+        resp = await client.post(url, params=params, json=body, headers=headers)
+    if resp.status_code != 200:
+        raise _http_error(resp, resp.content, url)
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _build_media_url(file_id: str, export_mime_type: Optional[str]) -> str:
+    """
+    Build the REST URL for a file's content (alt=media) or its export.
+    """
+    file_url = f"{DRIVE_API_BASE_URL}files/{quote(file_id, safe='')}"
+    if export_mime_type:
+        query = urlencode({"mimeType": export_mime_type, "alt": "media"})
+        return f"{file_url}/export?{query}"
+    return f"{file_url}?alt=media"
+
+
+async def _download_media(
+    credentials: Credentials, file_id: str, export_mime_type: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Yield a Drive file's content, or its export, directly from the REST API.
+
+    Uses native async HTTP instead of MediaIoBaseDownload, so no worker thread
+    or per-chunk Range request is needed.
+    """
+    url = _build_media_url(file_id, export_mime_type)
+    headers = await asyncio.to_thread(_get_auth_headers, credentials, url)
+    client = get_http_client()
+    headers["user-agent"] = client.headers["user-agent"] + GZIP_USER_AGENT_SUFFIX
+
+    async with client.stream("GET", url, headers=headers) as resp:
+        if resp.status_code != 200:
+            raise _http_error(resp, await resp.aread(), url)
+
+        async for chunk in resp.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+            yield chunk
+
+
+async def _stream_to_tempfile(
+    credentials: Credentials, file_id: str, export_mime_type: Optional[str] = None
+) -> Tuple[str, int]:
+    """
+    Stream a Drive file's content (or export) to a temporary file.
+
+    A single worker thread writes the whole file, taking chunks from a bounded
+    queue as they arrive, so disk writes overlap the download and memory use
+    stays at a few chunks regardless of file size. Returns the temporary file
+    path and the number of bytes written; the caller is responsible for
+    removing the file.
+    """
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(
+        maxsize=DOWNLOAD_QUEUE_MAX_CHUNKS
+    )
+
+    async def _fill_queue() -> None:
+        try:
+            async for chunk in _download_media(credentials, file_id, export_mime_type):
+                await queue.put(chunk)
+        except BaseException:
+            # Drop unwritten chunks so the end marker fits and the writer stops
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            raise
+        await queue.put(None)
+
+    def _write_chunks(f) -> int:
+        written = 0
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+            if chunk is None:
+                return written
+            f.write(chunk)
+            written += len(chunk)
+
+    fill_task = None
+    temp_file = NamedTemporaryFile(delete=False)
+    try:
+        with temp_file:
+            fill_task = asyncio.create_task(_fill_queue())
+            total_bytes = await asyncio.to_thread(_write_chunks, temp_file)
+            # Raises the download error, if that is what stopped the writer
+            await fill_task
+    except BaseException:
+        if fill_task is not None and not fill_task.done():
+            fill_task.cancel()
+        os.unlink(temp_file.name)
+        raise
+
+    return temp_file.name, total_bytes
+
+
+class _QueueMediaUpload(MediaUpload):
+    """
+    Resumable upload body fed from an asyncio.Queue of downloaded chunks.
+
+    getbytes() runs in the upload worker thread and waits on the event loop for
+    more data, so the upload starts before the download has finished. A None
+    item marks the end of the data; an exception item aborts the upload.
+    """
+
+    def __init__(
+        self,
+        queue: "asyncio.Queue",
+        loop: asyncio.AbstractEventLoop,
+        mimetype: str,
+        chunksize: int = UPLOAD_CHUNK_SIZE_BYTES,
+    ):
+        super().__init__()
+        self.queue = queue
+        self._loop = loop
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        # Bytes from the last requested offset onwards, kept for retries
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._total_size: Optional[int] = None
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        return self._total_size
+
+    def resumable(self):
+        return True
+
+    def abort(self, error: BaseException) -> None:
+        """Wake a waiting reader with an error. Must run on the event loop."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(error)
+
+    async def prefetch(self) -> None:
+        """
+        Buffer one chunk beyond the next upload request.
+
+        The resumable protocol needs the total size on the request carrying the
+        final chunk, so the end of the data must be seen one chunk early.
+        """
+        while self._total_size is None and len(self._buffer) <= 2 * self._chunksize:
+            item = await self.queue.get()
+            if item is None:
+                self._total_size = self._buffer_start + len(self._buffer)
+            elif isinstance(item, BaseException):
+                raise IOError(f"Download from fileUrl failed: {item!r}") from item
+            else:
+                self._buffer.extend(item)
+
+    def getbytes(self, begin, length):
+        # Everything before begin has been acknowledged by the server
+        del self._buffer[: begin - self._buffer_start]
+        self._buffer_start = begin
+        asyncio.run_coroutine_threadsafe(self.prefetch(), self._loop).result()
+        return bytes(self._buffer[:length])
+
+
+async def _pump_response(resp: httpx.Response, media: _QueueMediaUpload) -> int:
+    """
+    Feed a streaming HTTP response into a queue-backed upload.
+
+    Returns the number of bytes downloaded.
+    """
+    total_bytes = 0
+    try:
+        async for chunk in resp.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
+            await media.queue.put(chunk)
+            total_bytes += len(chunk)
+    except BaseException as e:
+        media.abort(e)
+        raise
+    await media.queue.put(None)
+    return total_bytes
+
+
+async def _read_file_body_text(file_path: str, size_bytes: int, mime_type: str) -> str:
+    """
+    Extract readable text from a downloaded file.
+
+    Office XML extraction is CPU-bound, so it runs in a worker process that
+    reads the file by path; other content is decoded via a read-only mmap.
+    """
+    if size_bytes == 0:
+        return ""
+
+    # Attempt Office XML extraction only for actual Office XML files
+    if mime_type in OFFICE_XML_MIME_TYPES:
+        office_text = await asyncio.get_running_loop().run_in_executor(
+            get_office_extraction_pool(),
+            extract_office_xml_text_from_path,
+            file_path,
+            mime_type,
+        )
+        if office_text:
+            return office_text
+
+    with (
+        open(file_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view,
+    ):
+        # Fallback: try UTF-8 unless the content is clearly binary
+        if not looks_like_binary(view):
+            try:
+                return str(view, "utf-8")
+            except UnicodeDecodeError:
+                pass
+        return (
+            f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
+            f"{size_bytes} bytes]"
+        )
 
 
 @server.tool()
@@ -73,24 +451,29 @@ async def search_drive_files(
         str: 見つかったファイル/フォルダのフォーマット済みリスト（ID、名前、タイプ、サイズ、更新日時、リンク）。
     """
     logger.info(
-        f"[search_drive_files] Invoked. Email: '{user_google_email}', Query: '{query}'"
+        "[search_drive_files] Invoked. Email: '%s', Query: '%s'",
+        user_google_email,
+        query,
     )
 
     # Check if the query looks like a structured Drive query or free text
     # Look for Drive API operators and structured query patterns
-    is_structured_query = any(pattern.search(query) for pattern in DRIVE_QUERY_PATTERNS)
+    is_structured_query = bool(DRIVE_QUERY_COMBINED.search(query))
 
     if is_structured_query:
         final_query = query
         logger.info(
-            f"[search_drive_files] Using structured query as-is: '{final_query}'"
+            "[search_drive_files] Using structured query as-is: '%s'",
+            final_query,
         )
     else:
         # For free text queries, wrap in fullText contains
-        escaped_query = query.replace("'", "\\'")
+        escaped_query = escape_drive_query_value(query)
         final_query = f"fullText contains '{escaped_query}'"
         logger.info(
-            f"[search_drive_files] Reformatting free text query '{query}' to '{final_query}'"
+            "[search_drive_files] Reformatting free text query '%s' to '%s'",
+            query,
+            final_query,
         )
 
     list_params = build_drive_list_params(
@@ -99,6 +482,7 @@ async def search_drive_files(
         drive_id=drive_id,
         include_items_from_all_drives=include_items_from_all_drives,
         corpora=corpora,
+        fields=FILE_LISTING_FIELDS,
     )
 
     results = await asyncio.to_thread(service.files().list(**list_params).execute)
@@ -106,16 +490,14 @@ async def search_drive_files(
     if not files:
         return f"No files found for '{query}'."
 
-    formatted_files_text_parts = [
-        f"Found {len(files)} files for {user_google_email} matching '{query}':"
-    ]
-    for item in files:
-        size_str = f", Size: {item.get('size', 'N/A')}" if "size" in item else ""
-        formatted_files_text_parts.append(
-            f'- Name: "{item["name"]}" (ID: {item["id"]}, Type: {item["mimeType"]}{size_str}, Modified: {item.get("modifiedTime", "N/A")}) Link: {item.get("webViewLink", "#")}'
-        )
-    text_output = "\n".join(formatted_files_text_parts)
-    return text_output
+    remember_folder_ids(
+        user_google_email,
+        (f["id"] for f in files if f.get("mimeType") == FOLDER_MIME_TYPE),
+    )
+    return _format_file_listing(
+        f"Found {len(files)} files for {user_google_email} matching '{query}':",
+        files,
+    )
 
 
 @server.tool()
@@ -141,7 +523,7 @@ async def get_drive_file_content(
     Returns:
         str: メタデータヘッダー付きのプレーンテキストとしてのファイルコンテンツ。
     """
-    logger.info(f"[get_drive_file_content] Invoked. File ID: '{file_id}'")
+    logger.info("[get_drive_file_content] Invoked. File ID: '%s'", file_id)
 
     resolved_file_id, file_metadata = await resolve_drive_item(
         service,
@@ -157,49 +539,13 @@ async def get_drive_file_content(
         "application/vnd.google-apps.presentation": "text/plain",
     }.get(mime_type)
 
-    request_obj = (
-        service.files().export_media(fileId=file_id, mimeType=export_mime_type)
-        if export_mime_type
-        else service.files().get_media(fileId=file_id)
+    temp_path, size_bytes = await _stream_to_tempfile(
+        get_service_credentials(service), file_id, export_mime_type
     )
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
-    done = False
-    while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-    file_content_bytes = fh.getvalue()
-
-    # Attempt Office XML extraction only for actual Office XML files
-    office_mime_types = {
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    }
-
-    if mime_type in office_mime_types:
-        office_text = extract_office_xml_text(file_content_bytes, mime_type)
-        if office_text:
-            body_text = office_text
-        else:
-            # Fallback: try UTF-8; otherwise flag binary
-            try:
-                body_text = file_content_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                body_text = (
-                    f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                    f"{len(file_content_bytes)} bytes]"
-                )
-    else:
-        # For non-Office files (including Google native files), try UTF-8 decode directly
-        try:
-            body_text = file_content_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            body_text = (
-                f"[Binary or unsupported text encoding for mimeType '{mime_type}' - "
-                f"{len(file_content_bytes)} bytes]"
-            )
+    try:
+        body_text = await _read_file_body_text(temp_path, size_bytes, mime_type)
+    finally:
+        os.unlink(temp_path)
 
     # Assemble response
     header = (
@@ -241,7 +587,9 @@ async def get_drive_file_download_url(
         str: ダウンロードURLとファイルメタデータ。ファイルはURLで1時間利用可能です。
     """
     logger.info(
-        f"[get_drive_file_download_url] Invoked. File ID: '{file_id}', Export format: {export_format}"
+        "[get_drive_file_download_url] Invoked. File ID: '%s', Export format: %s",
+        file_id,
+        export_format,
     )
 
     # Resolve shortcuts and get file metadata
@@ -259,70 +607,27 @@ async def get_drive_file_download_url(
     output_filename = file_name
     output_mime_type = mime_type
 
-    if mime_type == "application/vnd.google-apps.document":
-        # Google Docs
-        if export_format == "docx":
-            export_mime_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".docx"):
-                output_filename = f"{Path(output_filename).stem}.docx"
-        else:
-            # Default to PDF
-            export_mime_type = "application/pdf"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pdf"):
-                output_filename = f"{Path(output_filename).stem}.pdf"
-
-    elif mime_type == "application/vnd.google-apps.spreadsheet":
-        # Google Sheets
-        if export_format == "csv":
-            export_mime_type = "text/csv"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".csv"):
-                output_filename = f"{Path(output_filename).stem}.csv"
-        else:
-            # Default to XLSX
-            export_mime_type = (
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".xlsx"):
-                output_filename = f"{Path(output_filename).stem}.xlsx"
-
-    elif mime_type == "application/vnd.google-apps.presentation":
-        # Google Slides
-        if export_format == "pptx":
-            export_mime_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pptx"):
-                output_filename = f"{Path(output_filename).stem}.pptx"
-        else:
-            # Default to PDF
-            export_mime_type = "application/pdf"
-            output_mime_type = export_mime_type
-            if not output_filename.endswith(".pdf"):
-                output_filename = f"{Path(output_filename).stem}.pdf"
-
-    # Download the file
-    request_obj = (
-        service.files().export_media(fileId=file_id, mimeType=export_mime_type)
-        if export_mime_type
-        else service.files().get_media(fileId=file_id)
-    )
-
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
-    loop = asyncio.get_event_loop()
-    done = False
-    while not done:
-        status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-    file_content_bytes = fh.getvalue()
-    size_bytes = len(file_content_bytes)
-    size_kb = size_bytes / 1024 if size_bytes else 0
+    export_target = GOOGLE_EXPORT_FORMATS.get(
+        (mime_type, export_format)
+    ) or GOOGLE_EXPORT_FORMATS.get((mime_type, None))
+    if export_target:
+        export_mime_type, extension = export_target
+        output_mime_type = export_mime_type
+        output_filename = _ensure_ext(output_filename, extension)
 
     # Check if we're in stateless mode (can't save files)
     if is_stateless_mode():
+        # Nothing is stored, so keep only the preview while counting bytes
+        preview_bytes = bytearray()
+        size_bytes = 0
+        async for chunk in _download_media(
+            get_service_credentials(service), file_id, export_mime_type
+        ):
+            if len(preview_bytes) < DOWNLOAD_PREVIEW_BYTES:
+                preview_bytes += chunk[: DOWNLOAD_PREVIEW_BYTES - len(preview_bytes)]
+            size_bytes += len(chunk)
+        size_kb = size_bytes / 1024 if size_bytes else 0
+
         result_lines = [
             "File downloaded successfully!",
             f"File: {file_name}",
@@ -331,23 +636,27 @@ async def get_drive_file_download_url(
             f"MIME Type: {output_mime_type}",
             "\n⚠️ Stateless mode: File storage disabled.",
             "\nBase64-encoded content (first 100 characters shown):",
-            f"{base64.b64encode(file_content_bytes[:100]).decode('utf-8')}...",
+            f"{base64.b64encode(preview_bytes).decode('utf-8')}...",
         ]
         logger.info(
-            f"[get_drive_file_download_url] Successfully downloaded {size_kb:.1f} KB file (stateless mode)"
+            "[get_drive_file_download_url] Successfully downloaded %.1f KB file (stateless mode)",
+            size_kb,
         )
         return "\n".join(result_lines)
 
+    # Download the file
+    temp_path, size_bytes = await _stream_to_tempfile(
+        get_service_credentials(service), file_id, export_mime_type
+    )
+    size_kb = size_bytes / 1024 if size_bytes else 0
+
     # Save file and generate URL
     try:
         storage = get_attachment_storage()
 
-        # Encode bytes to base64 (as expected by AttachmentStorage)
-        base64_data = base64.urlsafe_b64encode(file_content_bytes).decode("utf-8")
-
-        # Save attachment
-        saved_file_id = storage.save_attachment(
-            base64_data=base64_data,
+        # Move the downloaded file into attachment storage
+        saved_file_id = storage.save_attachment_from_path(
+            temp_path,
             filename=output_filename,
             mime_type=output_mime_type,
         )
@@ -372,17 +681,23 @@ async def get_drive_file_download_url(
             )
 
         logger.info(
-            f"[get_drive_file_download_url] Successfully saved {size_kb:.1f} KB file as {saved_file_id}"
+            "[get_drive_file_download_url] Successfully saved %.1f KB file as %s",
+            size_kb,
+            saved_file_id,
         )
         return "\n".join(result_lines)
 
     except Exception as e:
-        logger.error(f"[get_drive_file_download_url] Failed to save file: {e}")
+        logger.error("[get_drive_file_download_url] Failed to save file: %s", e)
         return (
             f"Error: Failed to save file for download.\n"
             f"File was downloaded successfully ({size_kb:.1f} KB) but could not be saved.\n\n"
             f"Error details: {str(e)}"
         )
+    finally:
+        # Storage takes ownership of the file on success; clean up otherwise
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
 
 
 @server.tool()
@@ -414,10 +729,14 @@ async def list_drive_items(
         str: 指定されたフォルダ内のファイル/フォルダのフォーマット済みリスト。
     """
     logger.info(
-        f"[list_drive_items] Invoked. Email: '{user_google_email}', Folder ID: '{folder_id}'"
+        "[list_drive_items] Invoked. Email: '%s', Folder ID: '%s'",
+        user_google_email,
+        folder_id,
     )
 
-    resolved_folder_id = await resolve_folder_id(service, folder_id)
+    resolved_folder_id = await resolve_folder_id(
+        service, folder_id, user_email=user_google_email
+    )
     final_query = f"'{resolved_folder_id}' in parents and trashed=false"
 
     list_params = build_drive_list_params(
@@ -426,6 +745,7 @@ async def list_drive_items(
         drive_id=drive_id,
         include_items_from_all_drives=include_items_from_all_drives,
         corpora=corpora,
+        fields=FILE_LISTING_FIELDS,
     )
 
     results = await asyncio.to_thread(service.files().list(**list_params).execute)
@@ -433,16 +753,14 @@ async def list_drive_items(
     if not files:
         return f"No items found in folder '{folder_id}'."
 
-    formatted_items_text_parts = [
-        f"Found {len(files)} items in folder '{folder_id}' for {user_google_email}:"
-    ]
-    for item in files:
-        size_str = f", Size: {item.get('size', 'N/A')}" if "size" in item else ""
-        formatted_items_text_parts.append(
-            f'- Name: "{item["name"]}" (ID: {item["id"]}, Type: {item["mimeType"]}{size_str}, Modified: {item.get("modifiedTime", "N/A")}) Link: {item.get("webViewLink", "#")}'
-        )
-    text_output = "\n".join(formatted_items_text_parts)
-    return text_output
+    remember_folder_ids(
+        user_google_email,
+        (f["id"] for f in files if f.get("mimeType") == FOLDER_MIME_TYPE),
+    )
+    return _format_file_listing(
+        f"Found {len(files)} items in folder '{folder_id}' for {user_google_email}:",
+        files,
+    )
 
 
 @server.tool()
@@ -473,148 +791,105 @@ async def create_drive_file(
         str: ファイルリンクを含む、ファイル作成成功の確認メッセージ。
     """
     logger.info(
-        f"[create_drive_file] Invoked. Email: '{user_google_email}', File Name: {file_name}, Folder ID: {folder_id}, fileUrl: {fileUrl}"
+        "[create_drive_file] Invoked. Email: '%s', File Name: %s, Folder ID: %s, fileUrl: %s",
+        user_google_email,
+        file_name,
+        folder_id,
+        fileUrl,
     )
 
     if not content and not fileUrl:
         raise Exception("You must provide either 'content' or 'fileUrl'.")
 
-    file_data = None
-    resolved_folder_id = await resolve_folder_id(service, folder_id)
+    # Resolve the destination folder while the content is being fetched
+    folder_task = asyncio.create_task(
+        resolve_folder_id(service, folder_id, user_email=user_google_email)
+    )
 
     file_metadata = {
         "name": file_name,
-        "parents": [resolved_folder_id],
         "mimeType": mime_type,
     }
 
-    # Prefer fileUrl if both are provided
-    if fileUrl:
-        logger.info(f"[create_drive_file] Fetching file from URL: {fileUrl}")
-
-        # Check if this is a file:// URL
-        parsed_url = urlparse(fileUrl)
-        if parsed_url.scheme == "file":
-            # Handle file:// URL - read from local filesystem
-            logger.info(
-                "[create_drive_file] Detected file:// URL, reading from local filesystem"
-            )
-            transport_mode = get_transport_mode()
-            running_streamable = transport_mode == "streamable-http"
-            if running_streamable:
-                logger.warning(
-                    "[create_drive_file] file:// URL requested while server runs in streamable-http mode. Ensure the file path is accessible to the server (e.g., Docker volume) or use an HTTP(S) URL."
-                )
-
-            # Convert file:// URL to a cross-platform local path
-            raw_path = parsed_url.path or ""
-            netloc = parsed_url.netloc
-            if netloc and netloc.lower() != "localhost":
-                raw_path = f"//{netloc}{raw_path}"
-            file_path = url2pathname(raw_path)
-
-            # Verify file exists
-            path_obj = Path(file_path)
-            if not path_obj.exists():
-                extra = (
-                    " The server is running via streamable-http, so file:// URLs must point to files inside the container or remote host."
-                    if running_streamable
-                    else ""
-                )
-                raise Exception(f"Local file does not exist: {file_path}.{extra}")
-            if not path_obj.is_file():
-                extra = (
-                    " In streamable-http/Docker deployments, mount the file into the container or provide an HTTP(S) URL."
-                    if running_streamable
-                    else ""
-                )
-                raise Exception(f"Path is not a file: {file_path}.{extra}")
-
-            logger.info(f"[create_drive_file] Reading local file: {file_path}")
-
-            # Read file and upload
-            file_data = await asyncio.to_thread(path_obj.read_bytes)
-            total_bytes = len(file_data)
-            logger.info(f"[create_drive_file] Read {total_bytes} bytes from local file")
-
-            media = MediaIoBaseUpload(
-                io.BytesIO(file_data),
-                mimetype=mime_type,
-                resumable=True,
-                chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-            )
+    pump_task = None
+    try:
+        async with AsyncExitStack() as stack:
+            # Prefer fileUrl if both are provided
+            if fileUrl:
+                logger.info("[create_drive_file] Fetching file from URL: %s", fileUrl)
+
+                # Check if this is a file:// URL
+                parsed_url = urlsplit(fileUrl)
+                if parsed_url.scheme == "file":
+                    # Handle file:// URL - read from local filesystem
+                    logger.info(
+                        "[create_drive_file] Detected file:// URL, reading from local filesystem"
+                    )
+                    transport_mode = get_transport_mode()
+                    running_streamable = transport_mode == "streamable-http"
+                    if running_streamable:
+                        logger.warning(
+                            "[create_drive_file] file:// URL requested while server runs in streamable-http mode. Ensure the file path is accessible to the server (e.g., Docker volume) or use an HTTP(S) URL."
+                        )
 
-            logger.info("[create_drive_file] Starting upload to Google Drive...")
-            created_file = await asyncio.to_thread(
-                service.files()
-                .create(
-                    body=file_metadata,
-                    media_body=media,
-                    fields="id, name, webViewLink",
-                    supportsAllDrives=True,
-                )
-                .execute
-            )
-        # Handle HTTP/HTTPS URLs
-        elif parsed_url.scheme in ("http", "https"):
-            # when running in stateless mode, deployment may not have access to local file system
-            if is_stateless_mode():
-                async with httpx.AsyncClient(follow_redirects=True) as client:
-                    resp = await client.get(fileUrl)
-                    if resp.status_code != 200:
+                    # Convert file:// URL to a cross-platform local path
+                    raw_path = parsed_url.path or ""
+                    netloc = parsed_url.netloc
+                    if netloc and netloc.lower() != "localhost":
+                        raw_path = f"//{netloc}{raw_path}"
+                    file_path = url2pathname(raw_path)
+
+                    # Verify file exists
+                    path_obj = Path(file_path)
+                    if not path_obj.exists():
+                        extra = (
+                            " The server is running via streamable-http, so file:// URLs must point to files inside the container or remote host."
+                            if running_streamable
+                            else ""
+                        )
                         raise Exception(
-                            f"Failed to fetch file from URL: {fileUrl} (status {resp.status_code})"
+                            f"Local file does not exist: {file_path}.{extra}"
                         )
-                    file_data = await resp.aread()
-                    # Try to get MIME type from Content-Type header
-                    content_type = resp.headers.get("Content-Type")
-                    if content_type and content_type != "application/octet-stream":
-                        mime_type = content_type
-                        file_metadata["mimeType"] = content_type
-                        logger.info(
-                            f"[create_drive_file] Using MIME type from Content-Type header: {content_type}"
+                    if not path_obj.is_file():
+                        extra = (
+                            " In streamable-http/Docker deployments, mount the file into the container or provide an HTTP(S) URL."
+                            if running_streamable
+                            else ""
                         )
+                        raise Exception(f"Path is not a file: {file_path}.{extra}")
 
-                media = MediaIoBaseUpload(
-                    io.BytesIO(file_data),
-                    mimetype=mime_type,
-                    resumable=True,
-                    chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-                )
+                    logger.info("[create_drive_file] Reading local file: %s", file_path)
 
-                created_file = await asyncio.to_thread(
-                    service.files()
-                    .create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields="id, name, webViewLink",
-                        supportsAllDrives=True,
+                    # Upload straight from the file handle, one chunk at a time
+                    local_file = stack.enter_context(open(path_obj, "rb"))
+                    total_bytes = os.fstat(local_file.fileno()).st_size
+                    logger.info(
+                        "[create_drive_file] Uploading %s bytes from local file",
+                        total_bytes,
                     )
-                    .execute
-                )
-            else:
-                # Use NamedTemporaryFile to stream download and upload
-                with NamedTemporaryFile() as temp_file:
-                    total_bytes = 0
-                    # follow redirects
-                    async with httpx.AsyncClient(follow_redirects=True) as client:
-                        async with client.stream("GET", fileUrl) as resp:
+
+                    media = MediaIoBaseUpload(
+                        local_file,
+                        mimetype=mime_type,
+                        resumable=True,
+                        chunksize=UPLOAD_CHUNK_SIZE_BYTES,
+                    )
+                # Handle HTTP/HTTPS URLs
+                elif parsed_url.scheme in ("http", "https"):
+                    # when running in stateless mode, deployment may not have access to local file system
+                    if is_stateless_mode():
+                        # Accumulate chunks into a single growable buffer that the
+                        # upload reads from directly, without an intermediate copy
+                        file_buffer = io.BytesIO()
+                        async with get_http_client().stream("GET", fileUrl) as resp:
                             if resp.status_code != 200:
                                 raise Exception(
                                     f"Failed to fetch file from URL: {fileUrl} (status {resp.status_code})"
                                 )
-
-                            # Stream download in chunks
                             async for chunk in resp.aiter_bytes(
                                 chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES
                             ):
-                                await asyncio.to_thread(temp_file.write, chunk)
-                                total_bytes += len(chunk)
-
-                            logger.info(
-                                f"[create_drive_file] Downloaded {total_bytes} bytes from URL before upload."
-                            )
-
+                                file_buffer.write(chunk)
                             # Try to get MIME type from Content-Type header
                             content_type = resp.headers.get("Content-Type")
                             if (
@@ -622,61 +897,96 @@ async def create_drive_file(
                                 and content_type != "application/octet-stream"
                             ):
                                 mime_type = content_type
-                                file_metadata["mimeType"] = mime_type
+                                file_metadata["mimeType"] = content_type
                                 logger.info(
-                                    f"[create_drive_file] Using MIME type from Content-Type header: {mime_type}"
+                                    "[create_drive_file] Using MIME type from Content-Type header: %s",
+                                    content_type,
                                 )
 
-                    # Reset file pointer to beginning for upload
-                    temp_file.seek(0)
+                        file_buffer.seek(0)
+                        media = MediaIoBaseUpload(
+                            file_buffer,
+                            mimetype=mime_type,
+                            resumable=True,
+                            chunksize=UPLOAD_CHUNK_SIZE_BYTES,
+                        )
+                    else:
+                        # Start uploading while the download is still running;
+                        # the bounded queue keeps at most a few chunks in memory
+                        resp = await stack.enter_async_context(
+                            get_http_client().stream("GET", fileUrl)
+                        )
+                        if resp.status_code != 200:
+                            raise Exception(
+                                f"Failed to fetch file from URL: {fileUrl} (status {resp.status_code})"
+                            )
 
-                    # Upload with chunking
-                    media = MediaIoBaseUpload(
-                        temp_file,
-                        mimetype=mime_type,
-                        resumable=True,
-                        chunksize=UPLOAD_CHUNK_SIZE_BYTES,
-                    )
+                        # Try to get MIME type from Content-Type header
+                        content_type = resp.headers.get("Content-Type")
+                        if content_type and content_type != "application/octet-stream":
+                            mime_type = content_type
+                            file_metadata["mimeType"] = mime_type
+                            logger.info(
+                                "[create_drive_file] Using MIME type from Content-Type header: %s",
+                                mime_type,
+                            )
 
-                    logger.info(
-                        "[create_drive_file] Starting upload to Google Drive..."
-                    )
-                    created_file = await asyncio.to_thread(
-                        service.files()
-                        .create(
-                            body=file_metadata,
-                            media_body=media,
-                            fields="id, name, webViewLink",
-                            supportsAllDrives=True,
+                        media = _QueueMediaUpload(
+                            asyncio.Queue(maxsize=UPLOAD_QUEUE_MAX_CHUNKS),
+                            asyncio.get_running_loop(),
+                            mimetype=mime_type,
                         )
-                        .execute
+                        pump_task = asyncio.create_task(_pump_response(resp, media))
+                        await media.prefetch()
+                else:
+                    if not parsed_url.scheme:
+                        raise Exception(
+                            "fileUrl is missing a URL scheme. Use file://, http://, or https://."
+                        )
+                    raise Exception(
+                        f"Unsupported URL scheme '{parsed_url.scheme}'. Only file://, http://, and https:// are supported."
                     )
-        else:
-            if not parsed_url.scheme:
-                raise Exception(
-                    "fileUrl is missing a URL scheme. Use file://, http://, or https://."
+            elif content:
+                media = MediaInMemoryUpload(
+                    content.encode("utf-8"), mimetype=mime_type, resumable=True
                 )
-            raise Exception(
-                f"Unsupported URL scheme '{parsed_url.scheme}'. Only file://, http://, and https:// are supported."
-            )
-    elif content:
-        file_data = content.encode("utf-8")
-        media = io.BytesIO(file_data)
-
-        created_file = await asyncio.to_thread(
-            service.files()
-            .create(
-                body=file_metadata,
-                media_body=MediaIoBaseUpload(media, mimetype=mime_type, resumable=True),
-                fields="id, name, webViewLink",
-                supportsAllDrives=True,
+
+            file_metadata["parents"] = [await folder_task]
+
+            logger.info("[create_drive_file] Starting upload to Google Drive...")
+            upload = asyncio.to_thread(
+                service.files()
+                .create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields="id, name, webViewLink",
+                    supportsAllDrives=True,
+                )
+                .execute
             )
-            .execute
-        )
+            if pump_task:
+                created_file, total_bytes = await asyncio.gather(upload, pump_task)
+                logger.info(
+                    "[create_drive_file] Streamed %s bytes from URL to Drive.",
+                    total_bytes,
+                )
+            else:
+                created_file = await upload
+    finally:
+        if pump_task:
+            if not pump_task.done():
+                pump_task.cancel()
+            elif not pump_task.cancelled():
+                pump_task.exception()
+        if not folder_task.done():
+            folder_task.cancel()
+        elif not folder_task.cancelled():
+            # Retrieve a resolution error left behind when the fetch failed first
+            folder_task.exception()
 
     link = created_file.get("webViewLink", "No link available")
     confirmation_message = f"Successfully created file '{created_file.get('name', file_name)}' (ID: {created_file.get('id', 'N/A')}) in folder '{folder_id}' for {user_google_email}. Link: {link}"
-    logger.info(f"Successfully created file. Link: {link}")
+    logger.info("Successfully created file. Link: %s", link)
     return confirmation_message
 
 
@@ -701,26 +1011,19 @@ async def get_drive_file_permissions(
         str: 共有ステータスとURLを含む詳細なファイルメタデータ。
     """
     logger.info(
-        f"[get_drive_file_permissions] Checking file {file_id} for {user_google_email}"
+        "[get_drive_file_permissions] Checking file %s for %s",
+        file_id,
+        user_google_email,
     )
 
-    resolved_file_id, _ = await resolve_drive_item(service, file_id)
+    # Resolve shortcuts and fetch comprehensive file metadata, including
+    # permissions with details, in the same request
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service, file_id, extra_fields=FILE_PERMISSIONS_FIELDS
+    )
     file_id = resolved_file_id
 
     try:
-        # Get comprehensive file metadata including permissions with details
-        file_metadata = await asyncio.to_thread(
-            service.files()
-            .get(
-                fileId=file_id,
-                fields="id, name, mimeType, size, modifiedTime, owners, "
-                "permissions(id, type, role, emailAddress, domain, expirationTime, permissionDetails), "
-                "webViewLink, webContentLink, shared, sharingUser, viewersCanCopyContent",
-                supportsAllDrives=True,
-            )
-            .execute
-        )
-
         # Format the response
         output_parts = [
             f"File: {file_metadata.get('name', 'Unknown')}",
@@ -785,10 +1088,75 @@ async def get_drive_file_permissions(
         return "\n".join(output_parts)
 
     except Exception as e:
-        logger.error(f"Error getting file permissions: {e}")
+        logger.error("Error getting file permissions: %s", e)
         return f"Error getting file permissions: {e}"
 
 
+@server.tool()
+@handle_http_errors(
+    "get_drive_file_permissions_bulk", is_read_only=True, service_type="drive"
+)
+@require_google_service("drive", "drive_read")
+async def get_drive_file_permissions_bulk(
+    service,
+    user_google_email: str,
+    file_ids: List[str],
+) -> str:
+    """
+    複数のGoogleドライブファイルの共有権限を一度に取得します。
+
+    リクエストはDriveのバッチエンドポイントでまとめて送信されるため、ファイルごとの往復が発生しません。
+
+    Args:
+        user_google_email (str): ユーザーのGoogleメールアドレス。必須。
+        file_ids (List[str]): 権限を確認するファイルのIDのリスト。必須。
+
+    Returns:
+        str: 各ファイルの共有ステータスと権限の概要。
+    """
+    logger.info(
+        "[get_drive_file_permissions_bulk] Checking %s files for %s",
+        len(file_ids),
+        user_google_email,
+    )
+
+    if not file_ids:
+        raise ValueError("file_ids list cannot be empty")
+
+    resolved_items = await batch_resolve_drive_items(
+        service, file_ids, extra_fields=BULK_PERMISSIONS_FIELDS
+    )
+
+    output_parts = [f"Permissions for {len(resolved_items)} files:"]
+    for requested_id, outcome in resolved_items.items():
+        output_parts.append("")
+        if isinstance(outcome, Exception):
+            output_parts.append(f"File ID: {requested_id}")
+            output_parts.append(f"  Error: {outcome}")
+            continue
+
+        resolved_id, file_metadata = outcome
+        output_parts.append(
+            f"File: {file_metadata.get('name', 'Unknown')} (ID: {resolved_id})"
+        )
+        output_parts.append(f"  Shared: {file_metadata.get('shared', False)}")
+
+        permissions = file_metadata.get("permissions", [])
+        if permissions:
+            output_parts.append("  Permissions:")
+            for perm in permissions:
+                output_parts.append(f"    - {format_permission_info(perm)}")
+        else:
+            output_parts.append("  No additional permissions (private file)")
+
+        has_public_link = check_public_link_permission(permissions)
+        output_parts.append(
+            f"  Anyone with the link: {'Yes' if has_public_link else 'No'}"
+        )
+
+    return "\n".join(output_parts)
+
+
 @server.tool()
 @handle_http_errors(
     "check_drive_file_public_access", is_read_only=True, service_type="drive"
@@ -809,25 +1177,49 @@ async def check_drive_file_public_access(
     Returns:
         str: ファイルの共有ステータスと、Google Docsで使用可能かどうかに関する情報。
     """
-    logger.info(f"[check_drive_file_public_access] Searching for {file_name}")
+    logger.info("[check_drive_file_public_access] Searching for %s", file_name)
 
-    # Search for the file
-    escaped_name = file_name.replace("'", "\\'")
-    query = f"name = '{escaped_name}'"
+    # Repeated checks of the same name reuse a recent lookup; write and share
+    # tools invalidate it when they touch one of the files involved
+    cached_lookup = get_cached_file_lookup(user_google_email, file_name)
+    if cached_lookup is not None:
+        files, file_id, file_metadata = cached_lookup
+    else:
+        escaped_name = escape_drive_query_value(file_name)
+        query = f"name = '{escaped_name}'"
 
-    list_params = {
-        "q": query,
-        "pageSize": 10,
-        "fields": "files(id, name, mimeType, webViewLink)",
-        "supportsAllDrives": True,
-        "includeItemsFromAllDrives": True,
-    }
+        list_params = {
+            "q": query,
+            "pageSize": 10,
+            "fields": f"files(id, mimeType, shortcutDetails(targetId), {PUBLIC_ACCESS_FIELDS})",
+            "supportsAllDrives": True,
+            "includeItemsFromAllDrives": True,
+        }
 
-    results = await asyncio.to_thread(service.files().list(**list_params).execute)
+        results = await asyncio.to_thread(service.files().list(**list_params).execute)
+
+        files = results.get("files", [])
+        if not files:
+            return f"No file found with name '{file_name}'"
+
+        # Check permissions for the first file; the listing already carries
+        # them unless it is a shortcut, which must be resolved to its target
+        file_metadata = files[0]
+        file_id = file_metadata["id"]
+        if file_metadata.get("mimeType") == SHORTCUT_MIME_TYPE:
+            target_id = (file_metadata.get("shortcutDetails") or {}).get("targetId")
+            file_id, file_metadata = await resolve_drive_item(
+                service,
+                target_id or file_id,
+                extra_fields=PUBLIC_ACCESS_FIELDS,
+            )
 
-    files = results.get("files", [])
-    if not files:
-        return f"No file found with name '{file_name}'"
+        cache_file_lookup(
+            user_google_email,
+            file_name,
+            [f["id"] for f in files] + [file_id],
+            (files, file_id, file_metadata),
+        )
 
     if len(files) > 1:
         output_parts = [f"Found {len(files)} files with name '{file_name}':"]
@@ -838,22 +1230,6 @@ async def check_drive_file_public_access(
     else:
         output_parts = []
 
-    # Check permissions for the first file
-    file_id = files[0]["id"]
-    resolved_file_id, _ = await resolve_drive_item(service, file_id)
-    file_id = resolved_file_id
-
-    # Get detailed permissions
-    file_metadata = await asyncio.to_thread(
-        service.files()
-        .get(
-            fileId=file_id,
-            fields="id, name, mimeType, permissions, webViewLink, webContentLink, shared",
-            supportsAllDrives=True,
-        )
-        .execute
-    )
-
     permissions = file_metadata.get("permissions", [])
 
     has_public_link = check_public_link_permission(permissions)
@@ -929,18 +1305,21 @@ async def update_drive_file(
     Returns:
         str: 適用された更新の詳細を含む確認メッセージ。
     """
-    logger.info(f"[update_drive_file] Updating file {file_id} for {user_google_email}")
-
-    current_file_fields = (
-        "name, description, mimeType, parents, starred, trashed, webViewLink, "
-        "writersCanShare, copyRequiresWriterPermission, properties"
-    )
-    resolved_file_id, current_file = await resolve_drive_item(
-        service,
-        file_id,
-        extra_fields=current_file_fields,
+    logger.info(
+        "[update_drive_file] Updating file %s for %s", file_id, user_google_email
     )
-    file_id = resolved_file_id
+
+    # Fetch only the current values the change report compares against
+    current_file_fields = ["name"]
+    for field_name, new_value in (
+        ("description", description),
+        ("starred", starred),
+        ("trashed", trashed),
+        ("writersCanShare", writers_can_share),
+        ("copyRequiresWriterPermission", copy_requires_writer_permission),
+    ):
+        if new_value is not None:
+            current_file_fields.append(field_name)
 
     # Build the update body with only specified fields
     update_body = {}
@@ -961,27 +1340,46 @@ async def update_drive_file(
     if properties is not None:
         update_body["properties"] = properties
 
-    async def _resolve_parent_arguments(parent_arg: Optional[str]) -> Optional[str]:
+    def _split_parent_argument(parent_arg: Optional[str]) -> List[str]:
         if not parent_arg:
-            return None
-        parent_ids = [part.strip() for part in parent_arg.split(",") if part.strip()]
-        if not parent_ids:
-            return None
+            return []
+        return [part.strip() for part in parent_arg.split(",") if part.strip()]
+
+    # Resolve the file (following shortcuts) and every added and removed
+    # parent concurrently, since neither lookup depends on the other
+    add_parent_ids = _split_parent_argument(add_parents)
+    remove_parent_ids = _split_parent_argument(remove_parents)
+    (resolved_file_id, current_file), resolved_parent_ids = await asyncio.gather(
+        resolve_drive_item(
+            service,
+            file_id,
+            extra_fields=", ".join(current_file_fields),
+        ),
+        resolve_folder_ids(
+            service, add_parent_ids + remove_parent_ids, user_email=user_google_email
+        ),
+    )
+    file_id = resolved_file_id
+
+    # The file's current parents are real folders, so later moves involving
+    # them skip the folder lookup
+    remember_folder_ids(user_google_email, current_file.get("parents", []))
 
-        resolved_ids = []
-        for parent in parent_ids:
-            resolved_parent = await resolve_folder_id(service, parent)
-            resolved_ids.append(resolved_parent)
-        return ",".join(resolved_ids)
+    resolved_add_parents = ",".join(resolved_parent_ids[: len(add_parent_ids)])
+    resolved_remove_parents = ",".join(resolved_parent_ids[len(add_parent_ids) :])
 
-    resolved_add_parents = await _resolve_parent_arguments(add_parents)
-    resolved_remove_parents = await _resolve_parent_arguments(remove_parents)
+    # Nothing to send, so skip the update round trip entirely
+    if not update_body and not resolved_add_parents and not resolved_remove_parents:
+        return (
+            f"No changes requested for file '{current_file.get('name', 'Unknown')}' "
+            f"(ID: {file_id})"
+        )
 
     # Build query parameters for parent changes
     query_params = {
         "fileId": file_id,
         "supportsAllDrives": True,
-        "fields": "id, name, description, mimeType, parents, starred, trashed, webViewLink, writersCanShare, copyRequiresWriterPermission, properties",
+        "fields": "id, name, webViewLink",
     }
 
     if resolved_add_parents:
@@ -998,6 +1396,10 @@ async def update_drive_file(
         service.files().update(**query_params).execute
     )
 
+    invalidate_file_lookups(file_id)
+    if name is not None:
+        invalidate_file_lookups(user_email=user_google_email, file_name=name)
+
     # Build response message
     output_parts = [
         f"✅ Successfully updated file: {updated_file.get('name', current_file['name'])}"
@@ -1070,6 +1472,7 @@ async def get_drive_shareable_link(
     service,
     user_google_email: str,
     file_id: str,
+    include_permissions: bool = False,
 ) -> str:
     """
     Googleドライブのファイルまたはフォルダの共有可能なリンクを取得します。
@@ -1077,27 +1480,28 @@ async def get_drive_shareable_link(
     Args:
         user_google_email (str): ユーザーのGoogleメールアドレス。必須。
         file_id (str): 共有可能なリンクを取得するファイルまたはフォルダのID。必須。
+        include_permissions (bool): 現在の権限一覧も含めるかどうか。デフォルトはFalseです。
 
     Returns:
         str: 共有可能なリンクと現在の共有ステータス。
     """
     logger.info(
-        f"[get_drive_shareable_link] Invoked. Email: '{user_google_email}', File ID: '{file_id}'"
+        "[get_drive_shareable_link] Invoked. Email: '%s', File ID: '%s'",
+        user_google_email,
+        file_id,
     )
 
-    resolved_file_id, _ = await resolve_drive_item(service, file_id)
-    file_id = resolved_file_id
-
-    file_metadata = await asyncio.to_thread(
-        service.files()
-        .get(
-            fileId=file_id,
-            fields="id, name, mimeType, webViewLink, webContentLink, shared, "
-            "permissions(id, type, role, emailAddress, domain, expirationTime)",
-            supportsAllDrives=True,
+    link_fields = "name, webViewLink, webContentLink, shared"
+    if include_permissions:
+        link_fields += (
+            ", permissions(id, type, role, emailAddress, domain, expirationTime)"
         )
-        .execute
+    resolved_file_id, file_metadata = await resolve_drive_item(
+        service,
+        file_id,
+        extra_fields=link_fields,
     )
+    file_id = resolved_file_id
 
     output_parts = [
         f"File: {file_metadata.get('name', 'Unknown')}",
@@ -1158,7 +1562,12 @@ async def share_drive_file(
         str: 権限の詳細と共有可能なリンクを含む確認。
     """
     logger.info(
-        f"[share_drive_file] Invoked. Email: '{user_google_email}', File ID: '{file_id}', Share with: '{share_with}', Role: '{role}', Type: '{share_type}'"
+        "[share_drive_file] Invoked. Email: '%s', File ID: '%s', Share with: '%s', Role: '%s', Type: '%s'",
+        user_google_email,
+        file_id,
+        share_with,
+        role,
+        share_type,
     )
 
     validate_share_role(role)
@@ -1192,8 +1601,6 @@ async def share_drive_file(
         permission_body["allowFileDiscovery"] = allow_file_discovery
 
     create_params = {
-        "fileId": file_id,
-        "body": permission_body,
         "supportsAllDrives": True,
         "fields": "id, type, role, emailAddress, domain, expirationTime",
     }
@@ -1203,8 +1610,11 @@ async def share_drive_file(
         if email_message:
             create_params["emailMessage"] = email_message
 
-    created_permission = await asyncio.to_thread(
-        service.permissions().create(**create_params).execute
+    created_permission = await _post_drive_json(
+        get_service_credentials(service),
+        f"files/{quote(file_id, safe='')}/permissions",
+        create_params,
+        permission_body,
     )
 
     output_parts = [
@@ -1235,7 +1645,7 @@ async def batch_share_drive_file(
 
     各受信者は異なるロールとオプションの有効期限を持つことができます。
 
-    注: 各受信者は順番に処理されます。受信者リストが非常に大きい場合は、複数の呼び出しに分割することを検討してください。
+    注: 権限の作成は最大100件ずつ1回のバッチリクエストにまとめて送信されます。
 
     Args:
         user_google_email (str): ユーザーのGoogleメールアドレス。必須。
@@ -1254,7 +1664,10 @@ async def batch_share_drive_file(
         str: 各受信者の成功/失敗を含む作成された権限の概要。
     """
     logger.info(
-        f"[batch_share_drive_file] Invoked. Email: '{user_google_email}', File ID: '{file_id}', Recipients: {len(recipients)}"
+        "[batch_share_drive_file] Invoked. Email: '%s', File ID: '%s', Recipients: %s",
+        user_google_email,
+        file_id,
+        len(recipients),
     )
 
     resolved_file_id, file_metadata = await resolve_drive_item(
@@ -1265,24 +1678,29 @@ async def batch_share_drive_file(
     if not recipients:
         raise ValueError("recipients list cannot be empty")
 
-    results = []
+    # One result line per recipient, keyed by its index in recipients;
+    # permission creates fill theirs in once the batch completes
+    result_lines: Dict[int, str] = {}
+    identifiers: Dict[str, str] = {}
+    create_requests = []
+    permissions = service.permissions()
     success_count = 0
     failure_count = 0
 
-    for recipient in recipients:
+    for index, recipient in enumerate(recipients):
         share_type = recipient.get("share_type", "user")
 
         if share_type == "domain":
             domain = recipient.get("domain")
             if not domain:
-                results.append("  - Skipped: missing domain for domain share")
+                result_lines[index] = "  - Skipped: missing domain for domain share"
                 failure_count += 1
                 continue
             identifier = domain
         else:
             email = recipient.get("email")
             if not email:
-                results.append("  - Skipped: missing email address")
+                result_lines[index] = "  - Skipped: missing email address"
                 failure_count += 1
                 continue
             identifier = email
@@ -1291,14 +1709,14 @@ async def batch_share_drive_file(
         try:
             validate_share_role(role)
         except ValueError as e:
-            results.append(f"  - {identifier}: Failed - {e}")
+            result_lines[index] = f"  - {identifier}: Failed - {e}"
             failure_count += 1
             continue
 
         try:
             validate_share_type(share_type)
         except ValueError as e:
-            results.append(f"  - {identifier}: Failed - {e}")
+            result_lines[index] = f"  - {identifier}: Failed - {e}"
             failure_count += 1
             continue
 
@@ -1317,7 +1735,7 @@ async def batch_share_drive_file(
                 validate_expiration_time(recipient["expiration_time"])
                 permission_body["expirationTime"] = recipient["expiration_time"]
             except ValueError as e:
-                results.append(f"  - {identifier}: Failed - {e}")
+                result_lines[index] = f"  - {identifier}: Failed - {e}"
                 failure_count += 1
                 continue
 
@@ -1333,15 +1751,23 @@ async def batch_share_drive_file(
             if email_message:
                 create_params["emailMessage"] = email_message
 
-        try:
-            created_permission = await asyncio.to_thread(
-                service.permissions().create(**create_params).execute
+        request_id = str(index)
+        identifiers[request_id] = identifier
+        create_requests.append((request_id, permissions.create(**create_params)))
+
+    # Send all permission creates together instead of one round trip each
+    responses = await execute_batch_requests(
+        service, create_requests, fallback_concurrency=DRIVE_SHARE_CONCURRENCY
+    )
+    for request_id, response in responses.items():
+        if isinstance(response, Exception):
+            result_lines[int(request_id)] = (
+                f"  - {identifiers[request_id]}: Failed - {str(response)}"
             )
-            results.append(f"  - {format_permission_info(created_permission)}")
-            success_count += 1
-        except HttpError as e:
-            results.append(f"  - {identifier}: Failed - {str(e)}")
             failure_count += 1
+        else:
+            result_lines[int(request_id)] = f"  - {format_permission_info(response)}"
+            success_count += 1
 
     output_parts = [
         f"Batch share results for '{file_metadata.get('name', 'Unknown')}'",
@@ -1350,13 +1776,9 @@ async def batch_share_drive_file(
         "",
         "Results:",
     ]
-    output_parts.extend(results)
-    output_parts.extend(
-        [
-            "",
-            f"View link: {file_metadata.get('webViewLink', 'N/A')}",
-        ]
-    )
+    output_parts.extend(result_lines[index] for index in range(len(recipients)))
+    output_parts.append("")
+    output_parts.append(f"View link: {file_metadata.get('webViewLink', 'N/A')}")
 
     return "\n".join(output_parts)
 
@@ -1371,6 +1793,7 @@ async def update_drive_permission(
     permission_id: str,
     role: Optional[str] = None,
     expiration_time: Optional[str] = None,
+    current_role: Optional[str] = None,
 ) -> str:
     """
     Googleドライブのファイルまたはフォルダの既存の権限を更新します。
@@ -1381,12 +1804,17 @@ async def update_drive_permission(
         permission_id (str): 更新する権限のID（get_drive_file_permissionsから取得）。必須。
         role (Optional[str]): 新しいロール - 'reader', 'commenter', または 'writer'。指定されない場合、ロールは変更されません。
         expiration_time (Optional[str]): RFC 3339形式の有効期限（例: "2025-01-15T00:00:00Z"）。権限の有効期限を設定または更新します。
+        current_role (Optional[str]): 権限の現在のロール（get_drive_file_permissionsから取得）。roleを指定せずに有効期限のみ更新する場合、これを指定すると現在のロールの取得を省略できます。この値はそのまま新しいロールとして送信されるため、誤った値を指定すると権限が変更されます。'reader', 'commenter', 'writer' のいずれかである必要があります。
 
     Returns:
         str: 更新された権限の詳細を含む確認。
     """
     logger.info(
-        f"[update_drive_permission] Invoked. Email: '{user_google_email}', File ID: '{file_id}', Permission ID: '{permission_id}', Role: '{role}'"
+        "[update_drive_permission] Invoked. Email: '%s', File ID: '%s', Permission ID: '%s', Role: '%s'",
+        user_google_email,
+        file_id,
+        permission_id,
+        role,
     )
 
     if not role and not expiration_time:
@@ -1394,6 +1822,9 @@ async def update_drive_permission(
 
     if role:
         validate_share_role(role)
+    elif current_role:
+        # current_role is sent as the role, so it must be a role we would set
+        validate_share_role(current_role)
     if expiration_time:
         validate_expiration_time(expiration_time)
 
@@ -1403,6 +1834,8 @@ async def update_drive_permission(
     file_id = resolved_file_id
 
     # Google API requires role in update body, so fetch current if not provided
+    if not role:
+        role = current_role
     if not role:
         current_permission = await asyncio.to_thread(
             service.permissions()
@@ -1463,7 +1896,10 @@ async def remove_drive_permission(
         str: 権限削除の確認。
     """
     logger.info(
-        f"[remove_drive_permission] Invoked. Email: '{user_google_email}', File ID: '{file_id}', Permission ID: '{permission_id}'"
+        "[remove_drive_permission] Invoked. Email: '%s', File ID: '%s', Permission ID: '%s'",
+        user_google_email,
+        file_id,
+        permission_id,
     )
 
     resolved_file_id, file_metadata = await resolve_drive_item(
@@ -1477,6 +1913,8 @@ async def remove_drive_permission(
         .execute
     )
 
+    invalidate_file_lookups(file_id)
+
     output_parts = [
         f"Successfully removed permission from '{file_metadata.get('name', 'Unknown')}'",
         "",
@@ -1514,7 +1952,10 @@ async def transfer_drive_ownership(
         str: 所有権転送の確認。
     """
     logger.info(
-        f"[transfer_drive_ownership] Invoked. Email: '{user_google_email}', File ID: '{file_id}', New owner: '{new_owner_email}'"
+        "[transfer_drive_ownership] Invoked. Email: '%s', File ID: '%s', New owner: '%s'",
+        user_google_email,
+        file_id,
+        new_owner_email,
     )
 
     resolved_file_id, file_metadata = await resolve_drive_item(
@@ -1544,6 +1985,8 @@ async def transfer_drive_ownership(
         .execute
     )
 
+    invalidate_file_lookups(file_id)
+
     output_parts = [
         f"Successfully transferred ownership of '{file_metadata.get('name', 'Unknown')}'",
         "",
@@ -17,20 +17,30 @@ from core.tool_registry import (
     filter_server_tools,
 )
 
-dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
-load_dotenv(dotenv_path=dotenv_path)
+logger = logging.getLogger(__name__)
 
-# Suppress googleapiclient discovery cache warning
-logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
 
-reload_oauth_config()
+def configure_environment():
+    """
+    Load .env and set up logging before the server starts.
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+    Called from main() rather than at import time: worker processes started
+    with the spawn method re-import this module and must not repeat it.
+    """
+    dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+    load_dotenv(dotenv_path=dotenv_path)
 
-configure_file_logging()
+    # Suppress googleapiclient discovery cache warning
+    logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
+
+    reload_oauth_config()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    configure_file_logging()
 
 
 def safe_print(text):
@@ -80,6 +90,8 @@ def main():
     Main entry point for the Google Workspace MCP server.
     Uses FastMCP's native streamable-http transport.
     """
+    configure_environment()
+
     # Configure safe logging for Windows Unicode handling
     configure_safe_logging()
 
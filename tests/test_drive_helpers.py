@@ -0,0 +1,76 @@
+import httplib2
+import pytest
+
+from gdrive.drive_helpers import execute_batch_requests
+
+
+class FakeRequest:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class FakeBatch:
+    def __init__(self, error):
+        self.error = error
+
+    def add(self, request, request_id=None):
+        pass
+
+    def execute(self):
+        raise self.error
+
+
+class FakeService:
+    def __init__(self, batch_error):
+        self.batch_error = batch_error
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self.batch_error)
+
+
+@pytest.mark.asyncio
+async def test_unsent_batch_records_connection_failures_per_request():
+    ok = FakeRequest(response={"id": "p1"})
+    refused = FakeRequest(error=ConnectionRefusedError("refused"))
+    not_found = FakeRequest(error=httplib2.ServerNotFoundError("no dns"))
+    service = FakeService(httplib2.ServerNotFoundError("no dns"))
+
+    results = await execute_batch_requests(
+        service,
+        [("0", ok), ("1", refused), ("2", not_found)],
+        fallback_concurrency=2,
+    )
+
+    assert results["0"] == {"id": "p1"}
+    assert isinstance(results["1"], ConnectionRefusedError)
+    assert isinstance(results["2"], httplib2.ServerNotFoundError)
+    assert [ok.calls, refused.calls, not_found.calls] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_sent_batch_failure_is_not_replayed():
+    request = FakeRequest(response={"id": "p1"})
+    service = FakeService(RuntimeError("503"))
+
+    results = await execute_batch_requests(
+        service, [("0", request)], fallback_concurrency=2
+    )
+
+    assert isinstance(results["0"], RuntimeError)
+    assert request.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_raises_without_fallback():
+    service = FakeService(httplib2.ServerNotFoundError("no dns"))
+
+    with pytest.raises(httplib2.ServerNotFoundError):
+        await execute_batch_requests(service, [("0", FakeRequest())])